@@ -0,0 +1,80 @@
+"""
+Paleta : Palette Extraction and Management Tool for Game Assets
+
+Names are loaded lazily on first access, so `import paleta` (or `import paleta.color`)
+does not pull in `requests`, PIL or NumPy until a feature that needs them is used.
+
+Names that match a submodule are not exported, since importing the submodule would
+replace them (use `from paleta.ramp import ramp`).
+"""
+
+from __future__ import annotations
+
+import importlib
+
+from paleta.version import VERSION
+
+__version__ = VERSION
+
+_EXPORTS = {
+    "Color": "paleta.color",
+    "color_average": "paleta.color",
+    "Palette": "paleta.palette",
+    "FrozenPalette": "paleta.palette",
+    "ConversionPalette": "paleta.palette",
+    "maximize_by_average": "paleta.palette",
+    "minimize_by_average": "paleta.palette",
+    "LospecAPI": "paleta.api",
+    "extract_palette": "paleta.image",
+    "extract_palette_ext": "paleta.image",
+    "extract_palette_sample": "paleta.image",
+    "PaletteEstimate": "paleta.image",
+    "export_palette": "paleta.image",
+    "convert_palette": "paleta.image",
+    "ConversionStats": "paleta.image",
+    "convert_regions": "paleta.image",
+    "convert_batch": "paleta.image",
+    "convert_palette_dedup": "paleta.image",
+    "load_pixels": "paleta.image",
+    "opaque_bbox": "paleta.image",
+    "RawImage": "paleta.image",
+    "extract_convert_palette": "paleta.image",
+    "gradient_map": "paleta.image",
+    "adjust_image": "paleta.image",
+    "simulate_cvd_image": "paleta.image",
+    "IndexedImage": "paleta.image",
+    "ConversionCache": "paleta.cache",
+    "cluster_palettes": "paleta.cluster",
+    "PaletteClusters": "paleta.cluster",
+    "hausdorff_distance": "paleta.cluster",
+    "adjust_conversion": "paleta.adjust",
+    "ContrastAnalysis": "paleta.accessibility",
+    "CVDAnalysis": "paleta.accessibility",
+    "screen_palettes": "paleta.accessibility",
+    "LookupTable": "paleta.lut",
+    "SharedLookupTable": "paleta.lut",
+    "nearest_table": "paleta.lut",
+    "conversion_quality": "paleta.quality",
+    "ConversionQuality": "paleta.quality",
+    "NameIndex": "paleta.names",
+    "nearest_names": "paleta.names",
+    "ramps": "paleta.ramp",
+    "reduce_palette": "paleta.reduce",
+    "reduce_conversion": "paleta.reduce",
+    "sort_palette": "paleta.sort",
+}
+
+__all__ = ["VERSION", "__version__", *_EXPORTS]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from paleta.array import BATCH_ELEMENTS, array_to_colors, colors_to_array, expand_ranges
+from paleta.color import Color
+from paleta.palette import Palette
+from paleta.space import linear_to_rgb, rgb_to_lab, rgb_to_linear
+
+WCAG_AA = 4.5
+WCAG_AA_LARGE = 3.0
+WCAG_AAA = 7.0
+
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+
+def relative_luminance(rgba: np.ndarray) -> np.ndarray:
+    """
+    WCAG Relative Luminance of RGB/A Values (N, 3+) in 0 - 255
+
+    :param rgba: Array of RGB/A Values
+    :return: np.ndarray(float64) in 0 - 1
+    """
+    return rgb_to_linear(np.asarray(rgba, dtype=np.float64)[..., :3]) @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(ca: Color | tuple, cb: Color | tuple) -> float:
+    """
+    WCAG Contrast Ratio between Two Colors (1 - 21)
+
+    :param ca: Color Object or Tuple (R,G,B,*A)
+    :param cb: Color Object or Tuple (R,G,B,*A)
+    :return: float
+    """
+    la, lb = relative_luminance(colors_to_array([ca, cb])).tolist()
+    return (max(la, lb) + 0.05) / (min(la, lb) + 0.05)
+
+
+class ContrastAnalysis:
+    """
+    Contrast Analysis of every Color Pair in a Palette (WCAG 2.x)
+    """
+
+    def __init__(self, palette: Palette | list):
+        self.colors = palette.to_list() if isinstance(palette, Palette) else list(palette)
+        self.luminance = relative_luminance(colors_to_array(self.colors))
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Full Contrast Ratio Matrix (N, N)
+
+        :return: np.ndarray(float64)
+        """
+        lum = self.luminance + 0.05
+        return np.maximum(lum[:, None], lum[None, :]) / np.minimum(lum[:, None], lum[None, :])
+
+    def pairs(self, threshold=WCAG_AA, passing=True) -> np.ndarray:
+        """
+        Index Pairs (i < j) that Pass (or Fail) a Contrast Threshold
+
+        Sorting by luminance turns the threshold into one binary search per color,
+        so the matrix is never materialized.
+
+        :param threshold: Minimum Contrast Ratio (float)
+        :param passing: Return Passing Pairs, otherwise Failing Pairs (bool)
+        :return: np.ndarray(int64) of (K, 2)
+        """
+        n = len(self.colors)
+        order = np.argsort(self.luminance, kind="stable")
+        lum = self.luminance[order]
+
+        # Lighter partners q > p pass when (lum[q] + 0.05) >= threshold * (lum[p] + 0.05)
+        bound = np.searchsorted(lum, threshold * (lum + 0.05) - 0.05 - 1e-12, side="left")
+        bound = np.maximum(bound, np.arange(n) + 1)
+
+        if passing:
+            low, high = expand_ranges(bound, np.full(n, n))
+        else:
+            low, high = expand_ranges(np.arange(n) + 1, bound)
+
+        result = np.sort(np.stack([order[low], order[high]], axis=1), axis=1)
+        return result[np.lexsort((result[:, 1], result[:, 0]))]
+
+    def ratios(self, pairs: np.ndarray) -> np.ndarray:
+        """
+        Contrast Ratio for Index Pairs
+
+        :param pairs: Array of Index Pairs (K, 2)
+        :return: np.ndarray(float64)
+        """
+        la = self.luminance[pairs[:, 0]] + 0.05
+        lb = self.luminance[pairs[:, 1]] + 0.05
+        return np.maximum(la, lb) / np.minimum(la, lb)
+
+    def count(self, threshold=WCAG_AA) -> int:
+        """
+        Number of Pairs that Pass a Contrast Threshold
+
+        :param threshold: Minimum Contrast Ratio (float)
+        :return: int
+        """
+        n = len(self.colors)
+        lum = np.sort(self.luminance)
+        bound = np.searchsorted(lum, threshold * (lum + 0.05) - 0.05 - 1e-12, side="left")
+        return int(np.maximum(n - np.maximum(bound, np.arange(n) + 1), 0).sum())
+
+    def passing(self, threshold=WCAG_AA) -> List[Tuple[Color, Color, float]]:
+        """
+        Color Pairs that Pass a Contrast Threshold
+
+        :param threshold: Minimum Contrast Ratio (float)
+        :return: list(tuple(Color, Color, float))
+        """
+        return self._to_colors(self.pairs(threshold, passing=True))
+
+    def failing(self, threshold=WCAG_AA) -> List[Tuple[Color, Color, float]]:
+        """
+        Color Pairs that Fail a Contrast Threshold
+
+        :param threshold: Minimum Contrast Ratio (float)
+        :return: list(tuple(Color, Color, float))
+        """
+        return self._to_colors(self.pairs(threshold, passing=False))
+
+    def _to_colors(self, pairs: np.ndarray) -> list:
+        return [
+            (self.colors[i], self.colors[j], ratio)
+            for (i, j), ratio in zip(pairs.tolist(), self.ratios(pairs).tolist())
+        ]
+
+
+# Machado, Oliveira and Fernandes (2009) at full severity, applied to linear RGB
+CVD_MATRICES = {
+    "protanopia": np.array([
+        [0.152286, 1.052583, -0.204868],
+        [0.114503, 0.786281, 0.099216],
+        [-0.003882, -0.048116, 1.051998],
+    ]),
+    "deuteranopia": np.array([
+        [0.367322, 0.860646, -0.227968],
+        [0.280085, 0.672501, 0.047413],
+        [-0.011820, 0.042940, 0.968881],
+    ]),
+    "tritanopia": np.array([
+        [1.255528, -0.076749, -0.178779],
+        [-0.078411, 0.930809, 0.147602],
+        [0.004733, 0.691367, 0.303900],
+    ]),
+    "achromatopsia": np.tile(_LUMINANCE_WEIGHTS, (3, 1)),
+}
+
+CVD_TYPES = tuple(CVD_MATRICES)
+CVD_THRESHOLD = 10.0
+
+_TO_LINEAR = rgb_to_linear(np.arange(256)).astype(np.float32)
+_FROM_LINEAR = np.clip(np.rint(linear_to_rgb(np.linspace(0, 1, 65536))), 0, 255).astype(np.uint8)
+
+
+def cvd_matrix(deficiency: str, severity=1.0) -> np.ndarray:
+    """
+    Linear RGB Simulation Matrix, Partial Severity Blends Linearly from the Identity
+
+    :param deficiency: "protanopia", "deuteranopia", "tritanopia" or "achromatopsia"
+    :param severity: 0 (Normal Vision) - 1 (Full Deficiency) (float)
+    :return: np.ndarray(float64) of (3, 3)
+    """
+    if deficiency not in CVD_MATRICES:
+        raise ValueError(f"Unsupported deficiency `{deficiency}`. Must be one of {list(CVD_MATRICES)}")
+    if not 0 <= severity <= 1:
+        raise ValueError(f"Severity must be within 0 - 1, got {severity}")
+
+    return (1 - severity) * np.eye(3) + severity * CVD_MATRICES[deficiency]
+
+
+def simulate_cvd(rgba: np.ndarray, deficiency: str, severity=1.0) -> np.ndarray:
+    """
+    Simulate Color Vision Deficiency on RGBA Values (..., 4) in 0 - 255 (Alpha is Kept)
+
+    :param rgba: Array of RGBA Values (uint8)
+    :param deficiency: "protanopia", "deuteranopia", "tritanopia" or "achromatopsia"
+    :param severity: 0 (Normal Vision) - 1 (Full Deficiency) (float)
+    :return: np.ndarray(uint8) of (..., 4)
+    """
+    matrix = cvd_matrix(deficiency, severity).astype(np.float32)
+    rgba = np.asarray(rgba, dtype=np.uint8)
+
+    linear = np.clip(_TO_LINEAR[rgba[..., :3]] @ matrix.T, 0, 1)
+    result = np.empty(rgba.shape, dtype=np.uint8)
+    result[..., :3] = _FROM_LINEAR[(linear * 65535 + 0.5).astype(np.uint16)]
+    result[..., 3] = rgba[..., 3]
+    return result
+
+
+def _palette_rgba(colors: list) -> np.ndarray:
+    return np.clip(np.rint(colors_to_array(colors)), 0, 255).astype(np.uint8)
+
+
+def _confusions(labs: list, simulated: list, threshold: float) -> list:
+    # Pairs that normal vision tells apart but the deficiency does not, batched over padded palettes
+    width = max((len(lab) for lab in labs), default=0)
+    if width < 2:
+        return [np.empty((0, 2), dtype=np.int64) for _ in labs]
+
+    def _distances(values, start, stop):
+        values = np.stack([np.concatenate([v, np.zeros((width - len(v), 3))]) for v in values[start:stop]])
+        sq = (values ** 2).sum(axis=-1)
+        return np.sqrt(np.maximum(sq[:, :, None] + sq[:, None, :] - 2 * values @ values.transpose(0, 2, 1), 0))
+
+    sizes = np.array([len(lab) for lab in labs])
+    idx = np.arange(width)
+    upper = idx[:, None] < idx[None, :]
+
+    result = []
+    step = max(BATCH_ELEMENTS // (width * width), 1)
+    for start in range(0, len(labs), step):
+        stop = min(start + step, len(labs))
+        valid = upper & (idx[None, None, :] < sizes[start:stop, None, None])
+        confused = valid & (_distances(labs, start, stop) >= threshold) & (_distances(simulated, start, stop) < threshold)
+
+        owner, i, j = np.nonzero(confused)
+        bounds = np.searchsorted(owner, np.arange(stop - start + 1))
+        pairs = np.stack([i, j], axis=1)
+        result.extend(pairs[bounds[k]:bounds[k + 1]] for k in range(stop - start))
+    return result
+
+
+class CVDAnalysis:
+    """
+    Color Vision Deficiency Screening of a Palette
+
+    Pairs are reported when their CIE76 ΔE is at least the threshold for normal
+    vision but falls below it under the simulated deficiency.
+    """
+
+    def __init__(self, palette: Palette | list, threshold=CVD_THRESHOLD, severity=1.0):
+        self.colors = palette.to_list() if isinstance(palette, Palette) else list(palette)
+        self.threshold = threshold
+        self.severity = severity
+        self.rgba = _palette_rgba(self.colors) if self.colors else np.empty((0, 4), dtype=np.uint8)
+        self.lab = rgb_to_lab(self.rgba[:, :3])
+
+    def simulated(self, deficiency: str) -> List[Color]:
+        """
+        Palette Colors as Seen with the Deficiency (in List Order)
+
+        :param deficiency: "protanopia", "deuteranopia", "tritanopia" or "achromatopsia"
+        :return: list(Color)
+        """
+        return array_to_colors(simulate_cvd(self.rgba, deficiency, self.severity))
+
+    def pairs(self, deficiency: str) -> np.ndarray:
+        """
+        Index Pairs (i < j) that Become Indistinguishable
+
+        :param deficiency: "protanopia", "deuteranopia", "tritanopia" or "achromatopsia"
+        :return: np.ndarray(int64) of (K, 2)
+        """
+        simulated = rgb_to_lab(simulate_cvd(self.rgba, deficiency, self.severity)[:, :3])
+        return _confusions([self.lab], [simulated], self.threshold)[0]
+
+    def indistinguishable(self, deficiency: str) -> List[Tuple[Color, Color]]:
+        """
+        Color Pairs that Become Indistinguishable
+
+        :param deficiency: "protanopia", "deuteranopia", "tritanopia" or "achromatopsia"
+        :return: list(tuple(Color, Color))
+        """
+        return [(self.colors[i], self.colors[j]) for i, j in self.pairs(deficiency).tolist()]
+
+    def report(self, deficiencies=CVD_TYPES) -> dict:
+        """
+        Number of Indistinguishable Pairs per Deficiency
+
+        :param deficiencies: Deficiency Names
+        :return: dict
+        """
+        return {deficiency: len(self.pairs(deficiency)) for deficiency in deficiencies}
+
+
+def screen_palettes(palettes: list, deficiencies=CVD_TYPES, threshold=CVD_THRESHOLD, severity=1.0) -> List[dict]:
+    """
+    Indistinguishable Index Pairs of many Palettes, Simulated and Compared in Batches
+
+    :param palettes: List of Palettes or Lists of Colors
+    :param deficiencies: Deficiency Names
+    :param threshold: Smallest ΔE (CIE76) of Distinguishable Colors (float)
+    :param severity: 0 (Normal Vision) - 1 (Full Deficiency) (float)
+    :return: list(dict) of {Deficiency : np.ndarray(int64) of (K, 2)} per Palette
+    """
+    rgba = [_palette_rgba(p.to_list() if isinstance(p, Palette) else list(p)) if len(p) else
+            np.empty((0, 4), dtype=np.uint8) for p in palettes]
+    if not rgba:
+        return []
+
+    flat = np.concatenate(rgba)
+    bounds = np.cumsum([0] + [len(r) for r in rgba])
+    labs = np.split(rgb_to_lab(flat[:, :3]), bounds[1:-1])
+
+    results = [{} for _ in rgba]
+    for deficiency in deficiencies:
+        simulated = np.split(rgb_to_lab(simulate_cvd(flat, deficiency, severity)[:, :3]), bounds[1:-1])
+        for result, pairs in zip(results, _confusions(labs, simulated, threshold)):
+            result[deficiency] = pairs
+    return results
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+
+from paleta.array import array_to_colors, colors_to_array
+from paleta.palette import Palette, ConversionPalette
+from paleta.space import hsl_to_rgb, hsv_to_rgb, rgb_to_hsl, rgb_to_hsv
+
+ADJUST_SPACES = {
+    "hsl": (rgb_to_hsl, hsl_to_rgb),
+    "hsv": (rgb_to_hsv, hsv_to_rgb),
+}
+
+
+def adjust_array(rgba: np.ndarray, hue=0.0, saturation=1.0, lightness=1.0, space="hsl") -> np.ndarray:
+    """
+    Shift Hue and Scale Saturation and Lightness (Value for HSV) of RGBA Values (..., 4)
+
+    :param rgba: Array of RGBA Values in 0 - 255
+    :param hue: Hue Shift in Degrees (float)
+    :param saturation: Saturation Factor (float)
+    :param lightness: Lightness or Value Factor (float)
+    :param space: Adjustment Space ("hsl", "hsv")
+    :return: np.ndarray(uint8) of (..., 4)
+    """
+    if space not in ADJUST_SPACES:
+        raise ValueError(f"Unsupported space `{space}`. Must be one of {list(ADJUST_SPACES)}")
+
+    forward, backward = ADJUST_SPACES[space]
+    rgba = np.asarray(rgba)
+    values = forward(rgba[..., :3])
+
+    values[..., 0] += hue
+    values[..., 1] = np.clip(values[..., 1] * saturation, 0, 1)
+    values[..., 2] = np.clip(values[..., 2] * lightness, 0, 1)
+
+    result = np.empty(rgba.shape, dtype=np.uint8)
+    result[..., :3] = np.clip(np.rint(backward(values)), 0, 255)
+    result[..., 3] = rgba[..., 3]
+    return result
+
+
+def adjust_conversion(palette: Palette | list, hue=0.0, saturation=1.0, lightness=1.0,
+                      space="hsl") -> ConversionPalette:
+    """
+    Conversion Palette from each Color to its Adjusted Color (for Palette Variants)
+
+    :param palette: Palette or List of Colors
+    :param hue: Hue Shift in Degrees (float)
+    :param saturation: Saturation Factor (float)
+    :param lightness: Lightness or Value Factor (float)
+    :param space: Adjustment Space ("hsl", "hsv")
+    :return: ConversionPalette
+    """
+    colors = palette.to_list() if isinstance(palette, Palette) else list(palette)
+    if not colors:
+        return ConversionPalette()
+
+    rgba = np.clip(np.rint(colors_to_array(colors)), 0, 255)
+    adjusted = array_to_colors(adjust_array(rgba, hue, saturation, lightness, space=space))
+    return ConversionPalette(dict(zip(colors, adjusted)))
@@ -1,6 +1,3 @@
-import requests
-
-
 class LospecAPI:
     """
     Lospec API (https://lospec.com/palettes/api)
@@ -11,6 +8,8 @@ class LospecAPI:
 
     @staticmethod
     def get_palette(name: str, fmt: str = "json") -> dict:
+        import requests
+
         return requests.get(
             LospecAPI.URL_STRUCTURE.format(
                 api=LospecAPI.PALETTE_API,
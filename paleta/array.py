@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import Tuple
+
+import numpy as np
+
+from paleta.color import Color
+
+TILE_ROWS = 256
+
+# Upper bound on the elements of one batch of pairwise distance matrices
+BATCH_ELEMENTS = 1 << 22
+
+
+def to_rgba_array(image) -> np.ndarray:
+    """
+    Get Pixel Buffer of Image as Array (Height, Width, 4)
+
+    :param image: PIL Image Object
+    :return: np.ndarray(uint8)
+    """
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return np.asarray(image, dtype=np.uint8)
+
+
+def pack_rgba(pixels: np.ndarray, view=False) -> np.ndarray:
+    """
+    Pack RGBA Channels (..., 4) into a Single uint32 per Pixel (Zero-Copy when Contiguous)
+
+    :param pixels: Array of RGBA Values (uint8)
+    :param view: Require a Zero-Copy View, so Writes Reach `pixels` (bool)
+    :return: np.ndarray(uint32)
+    """
+    if view and (not isinstance(pixels, np.ndarray) or pixels.dtype != np.uint8 or not pixels.flags.c_contiguous):
+        raise ValueError("Output pixels must be a C-contiguous uint8 array to be written through a packed view")
+
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    return pixels.view(np.uint32).reshape(pixels.shape[:-1])
+
+
+def unpack_rgba(packed: np.ndarray) -> np.ndarray:
+    """
+    Unpack uint32 Pixels into RGBA Channels (..., 4)
+
+    :param packed: Array of Packed Pixels (uint32)
+    :return: np.ndarray(uint8)
+    """
+    packed = np.ascontiguousarray(packed, dtype=np.uint32)
+    return packed.view(np.uint8).reshape(packed.shape + (4,))
+
+
+def colors_to_array(colors) -> np.ndarray:
+    """
+    Get Array (N, 4) of Colors or RGBA Tuples
+
+    :param colors: Iterable of Color Object or Tuple (R,G,B,*A)
+    :return: np.ndarray(float64)
+    """
+    rows = []
+    for color in colors:
+        if isinstance(color, Color):
+            rows.append(color.rgba)
+        elif isinstance(color, (tuple, list)):
+            rows.append(Color(*color).rgba)
+        else:
+            raise ValueError(f"Unable to convert color of type `{type(color)}` to array")
+
+    return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+
+def array_to_colors(array: np.ndarray) -> list:
+    """
+    Get List of Colors from Array (N, 3) or (N, 4)
+
+    :param array: Array of RGB/A Values
+    :return: list(Color)
+    """
+    return [Color(*row) for row in np.asarray(array).tolist()]
+
+
+def pack_colors(colors) -> np.ndarray:
+    """
+    Pack Colors into uint32 Values (Channels are Truncated to Integer)
+
+    :param colors: Iterable of Color Object or Tuple (R,G,B,*A)
+    :return: np.ndarray(uint32)
+    """
+    return pack_rgba(colors_to_array(colors).astype(np.uint8))
+
+
+def map_tiles(fn, height: int, workers: int = 1, tile_rows: int = TILE_ROWS) -> list:
+    """
+    Run a Function over Horizontal Tiles (Row Slices) of an Image on a Thread Pool
+
+    :param fn: Function taking a Row Slice
+    :param height: Image Height (int)
+    :param workers: Number of Threads, None for CPU Count (int)
+    :param tile_rows: Rows per Tile (int)
+    :return: list (Results in Tile Order)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tiles = [slice(y, min(y + tile_rows, height)) for y in range(0, height, max(tile_rows, 1))]
+    if workers <= 1 or len(tiles) <= 1:
+        return [fn(tile) for tile in tiles]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(tiles))) as pool:
+        return list(pool.map(fn, tiles))
+
+
+def expand_ranges(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expand Index Ranges [starts[i], ends[i]) into Flat (Owner, Position) Index Arrays
+
+    :param starts: Array of Range Starts (int)
+    :param ends: Array of Range Ends (int, Exclusive)
+    :return: tuple(np.ndarray(int64) Owner i, np.ndarray(int64) Position)
+    """
+    lengths = np.maximum(ends - starts, 0)
+    owner = np.repeat(np.arange(len(starts)), lengths)
+    offset = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return owner, starts[owner] + offset
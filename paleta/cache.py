@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+
+class ConversionCache:
+    """
+    Content-Addressed Cache of Converted Assets on Local Disk (Size-Based LRU Eviction)
+    """
+
+    SUFFIX = ".bin"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(*parts, **options) -> str:
+        """
+        Content Hash of Arrays, Bytes or Strings and Keyword Options
+
+        :param parts: Content to Hash (np.ndarray, bytes, str)
+        :param options: Options that Affect the Output
+        :return: str (Hexadecimal SHA-256)
+        """
+        digest = hashlib.sha256()
+
+        for part in parts:
+            if isinstance(part, np.ndarray):
+                part = np.ascontiguousarray(part)
+                digest.update(f"array:{part.dtype.str}:{part.shape}:".encode())
+                digest.update(part.tobytes())
+            elif isinstance(part, bytes):
+                digest.update(f"bytes:{len(part)}:".encode())
+                digest.update(part)
+            elif isinstance(part, str):
+                digest.update(f"str:{len(part)}:{part}".encode())
+            else:
+                raise TypeError(f'Unable to hash part of type "{type(part)}"')
+
+        for name in sorted(options):
+            digest.update(f"option:{name}={options[name]!r};".encode())
+
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Read Cached Asset and Mark it as Recently Used
+
+        :param key: Cache Key (str)
+        :return: bytes or None
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store Asset (Atomically) and Evict Least Recently Used Entries over the Size Limit
+
+        :param key: Cache Key (str)
+        :param data: Asset Content (bytes)
+        :return:
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self.path(key))
+
+        self.evict()
+
+    def __contains__(self, key: str):
+        return os.path.exists(self.path(key))
+
+    def entries(self) -> list:
+        """
+        Cache Entries as List of (Last Used, Size, Path), Oldest First
+
+        :return: list
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return sorted(entries)
+
+    def size(self) -> int:
+        """
+        Total Size of Cached Assets in Bytes
+
+        :return: int
+        """
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self) -> None:
+        """
+        Remove Least Recently Used Entries until the Cache Fits `max_bytes`
+
+        :return:
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Remove all Cached Assets
+
+        :return:
+        """
+        for _, _, path in self.entries():
+            os.remove(path)
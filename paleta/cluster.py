@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from paleta.array import BATCH_ELEMENTS, colors_to_array, expand_ranges
+from paleta.palette import Palette, FrozenPalette
+from paleta.space import to_space
+
+CLUSTER_SPACES = ("rgb", "oklab", "lab")
+
+
+def _points(palettes: list, space="oklab") -> list:
+    if space not in CLUSTER_SPACES:
+        raise ValueError(f"Unsupported space `{space}`. Must be one of {list(CLUSTER_SPACES)}")
+
+    points = []
+    for palette in palettes:
+        colors = palette.to_list() if isinstance(palette, (Palette, FrozenPalette)) else list(palette)
+        rgba = colors_to_array(colors) if colors else np.empty((0, 4))
+        points.append(to_space(rgba[:, :3], space))
+    return points
+
+
+# Pivots on a 3 x 3 x 3 RGB grid, the distance from a point to a palette moves by at most the Hausdorff distance
+_PIVOTS = np.stack(np.meshgrid(*[np.array([0.0, 127.5, 255.0])] * 3, indexing="ij"), axis=-1).reshape(-1, 3)
+
+
+def _signatures(points: list, space="oklab") -> np.ndarray:
+    pivots = to_space(_PIVOTS, space)
+    signatures = np.full((len(points), 6 + len(pivots)), np.inf)
+    for i, p in enumerate(points):
+        if len(p):
+            signatures[i, :3] = p.min(axis=0)
+            signatures[i, 3:6] = p.max(axis=0)
+            signatures[i, 6:] = np.sqrt(((pivots[:, None, :] - p[None, :, :]) ** 2).sum(axis=-1).min(axis=1))
+    return signatures
+
+
+def palette_signature(palettes: list, space="oklab") -> np.ndarray:
+    """
+    Palette Signatures: Per-Axis Minimum and Maximum, and Distances from 27 Fixed Pivot Colors
+
+    The largest difference between two signatures never exceeds the Hausdorff
+    distance of the palettes, so signatures can rule pairs out.
+
+    :param palettes: List of Palettes, FrozenPalettes or Lists of Colors
+    :param space: Color Space ("rgb", "oklab", "lab")
+    :return: np.ndarray(float64) of (N, 33), Infinite for Empty Palettes
+    """
+    return _signatures(_points(palettes, space), space)
+
+
+def _hausdorff(points: list, pairs: np.ndarray) -> np.ndarray:
+    # Pad every palette by repeating its first color, which leaves the distance unchanged
+    # (empty palettes are never paired, so they are padded with anything)
+    width = max(len(p) for p in points)
+    padded = np.stack([
+        np.concatenate([p, np.repeat(p[:1], width - len(p), axis=0)]) if len(p) else np.zeros((width, 3))
+        for p in points
+    ])
+
+    result = np.empty(len(pairs))
+    step = max(BATCH_ELEMENTS // (width * width), 1)
+    for start in range(0, len(pairs), step):
+        a = padded[pairs[start:start + step, 0]]
+        b = padded[pairs[start:start + step, 1]]
+        # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b as one batched matrix product
+        dist = (a ** 2).sum(axis=-1)[:, :, None] + (b ** 2).sum(axis=-1)[:, None, :] - 2 * a @ b.transpose(0, 2, 1)
+        directed = np.maximum(dist.min(axis=2).max(axis=1), dist.min(axis=1).max(axis=1))
+        result[start:start + step] = np.sqrt(np.maximum(directed, 0))
+    return result
+
+
+def hausdorff_distance(pa: Palette | list, pb: Palette | list, space="oklab") -> float:
+    """
+    Symmetric Hausdorff Distance between Palettes (Farthest Color from its Nearest Match)
+
+    :param pa: Palette, FrozenPalette or List of Colors
+    :param pb: Palette, FrozenPalette or List of Colors
+    :param space: Color Space ("rgb", "oklab", "lab")
+    :return: float
+    """
+    points = _points([pa, pb], space)
+    if len(points[0]) == 0 or len(points[1]) == 0:
+        return 0.0 if len(points[0]) == len(points[1]) else np.inf
+    return float(_hausdorff(points, np.array([[0, 1]]))[0])
+
+
+def _candidates(signatures: np.ndarray, threshold: float) -> np.ndarray:
+    valid = np.flatnonzero(np.all(np.isfinite(signatures), axis=1))
+    if len(valid) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Sweep along the most spread out signature axis, then check the others from most to least spread out
+    axes = np.argsort(-np.ptp(signatures[valid], axis=0), kind="stable")
+    order = valid[np.argsort(signatures[valid, axes[0]], kind="stable")]
+    keys = signatures[order, axes[0]]
+
+    n = len(order)
+    ends = np.searchsorted(keys, keys + threshold, side="right")
+    sizes = np.cumsum(ends - np.arange(n) - 1)
+
+    pairs = []
+    start = 0
+    while start < n:
+        # Expand the sweep windows in blocks of rows to bound memory
+        stop = max(int(np.searchsorted(sizes, sizes[start] + BATCH_ELEMENTS, side="right")), start + 1)
+        low, high = expand_ranges(np.arange(start, stop) + 1, ends[start:stop])
+        block = np.stack([order[low + start], order[high]], axis=1)
+
+        for axis in axes[1:].tolist():
+            block = block[np.abs(signatures[block[:, 0], axis] - signatures[block[:, 1], axis]) <= threshold]
+        pairs.append(block)
+        start = stop
+
+    return np.concatenate(pairs)
+
+
+class PaletteClusters:
+    """
+    Clusters of Near-Duplicate Palettes (Indices into the Input Collection)
+
+    Every member is within the threshold of its representative.
+    """
+
+    def __init__(self, palettes: list, labels: np.ndarray, representatives: np.ndarray, pairs: np.ndarray,
+                 distances: np.ndarray, candidates: int):
+        self.palettes = palettes
+        self.labels = labels
+        self.representatives = representatives
+        self.pairs = pairs
+        self.distances = distances
+        self.candidates = candidates
+
+    def clusters(self) -> List[List[int]]:
+        """
+        Member Indices per Cluster (Representative First)
+
+        :return: list(list(int))
+        """
+        members = [[int(rep)] for rep in self.representatives]
+        for i, label in enumerate(self.labels.tolist()):
+            if i != self.representatives[label]:
+                members[label].append(i)
+        return members
+
+    def unique(self) -> list:
+        """
+        Representative Palette of each Cluster
+
+        :return: list
+        """
+        return [self.palettes[i] for i in self.representatives.tolist()]
+
+    def duplicates(self) -> List[int]:
+        """
+        Indices of Palettes that are not Representatives
+
+        :return: list(int)
+        """
+        mask = np.ones(len(self.labels), dtype=bool)
+        mask[self.representatives] = False
+        return np.flatnonzero(mask).tolist()
+
+    def __len__(self):
+        return len(self.representatives)
+
+
+def cluster_palettes(palettes: list, threshold=0.03, space="oklab") -> PaletteClusters:
+    """
+    Group Near-Duplicate Palettes by Symmetric Hausdorff Distance
+
+    Signature blocking keeps only pairs whose signatures are within the threshold,
+    and the exact distance is computed in batches for those. Palettes with the most
+    near duplicates become representatives first, and take every unassigned neighbor.
+
+    :param palettes: List of Palettes, FrozenPalettes or Lists of Colors
+    :param threshold: Largest Distance between Duplicates (float, OKLab 0.02 is about one Shade)
+    :param space: Color Space ("rgb", "oklab", "lab")
+    :return: PaletteClusters
+    """
+    palettes = list(palettes)
+    points = _points(palettes, space)
+    n = len(points)
+
+    candidates = _candidates(_signatures(points, space), threshold)
+    if len(candidates):
+        distances = _hausdorff(points, candidates)
+        keep = distances <= threshold
+        pairs, distances = candidates[keep], distances[keep]
+    else:
+        pairs, distances = candidates, np.empty(0)
+
+    # Adjacency in CSR form
+    edges = np.concatenate([pairs, pairs[:, ::-1]]) if len(pairs) else np.empty((0, 2), dtype=np.int64)
+    edges = edges[np.argsort(edges[:, 0], kind="stable")]
+    degree = np.bincount(edges[:, 0], minlength=n)
+    offsets = np.concatenate([[0], np.cumsum(degree)])
+
+    labels = np.full(n, -1, dtype=np.int64)
+    representatives = []
+    for i in np.argsort(-degree, kind="stable").tolist():
+        if labels[i] >= 0:
+            continue
+        neighbors = edges[offsets[i]:offsets[i + 1], 1]
+        labels[neighbors[labels[neighbors] < 0]] = len(representatives)
+        labels[i] = len(representatives)
+        representatives.append(i)
+
+    return PaletteClusters(palettes, labels, np.array(representatives, dtype=np.int64), pairs, distances,
+                           len(candidates))
@@ -433,6 +433,17 @@ class Color:
             y = (y - k) / (1 - k)
             return round(c, dec), round(m, dec), round(y, dec), round(k, dec)
 
+    def to_name(self, names="css"):
+        """
+        Get Nearest Color Name (OKLab) from a Bundled Name Set
+
+        :param names: Name Set ("css", "x11", "xkcd")
+        :return: str
+        """
+        from paleta.names import nearest_name
+
+        return nearest_name(self, names=names)
+
     def copy(self):
         """
         Copy Vector Object
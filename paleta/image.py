@@ -1,12 +1,33 @@
 from __future__ import annotations
 
+import io
+import math
+import os
+import queue
+import threading
+from typing import List
+
+import numpy as np
+
+from paleta.accessibility import cvd_matrix, simulate_cvd
+from paleta.adjust import adjust_array
+from paleta.array import TILE_ROWS, map_tiles, to_rgba_array, pack_rgba, unpack_rgba
+from paleta.cache import ConversionCache
+from paleta.lut import LookupTable
 from paleta.palette import Palette, ConversionPalette
 from paleta.color import Color
+from paleta.ramp import gradient_table
 
 from PIL import Image, ImageDraw, ImageFile
 
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 
+TABLE_COLORS = 4096
+TRANSLUCENT = ("keep", "skip", "opaque")
+
+# Alpha channel bits of a packed pixel
+_ALPHA = pack_rgba(np.array([0, 0, 0, 255], dtype=np.uint8))[()]
+
 
 def extract_palette(f: str) -> Palette:
     image = Image.open(f)
@@ -22,16 +43,352 @@ def extract_palette(f: str) -> Palette:
     return new_palette
 
 
-def extract_palette_ext(f: str, alpha_threshold=0) -> Palette:
-    image = Image.open(f)
-    image = image.convert("RGBA")
+def _bbox(pixels: np.ndarray, alpha_threshold=0) -> tuple | None:
+    # Reducing with max avoids materializing a full-canvas mask
+    alpha = pixels[..., 3]
+    rows = np.flatnonzero(alpha.max(axis=1) > alpha_threshold)
+    if len(rows) == 0:
+        return None
 
-    new_palette = Palette()
-    for pix in image.getdata():
-        if pix[-1] > alpha_threshold:
-            new_palette.add(pix)
+    cols = np.flatnonzero(alpha[rows[0]:rows[-1] + 1].max(axis=0) > alpha_threshold)
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
 
-    return new_palette
+
+def opaque_bbox(f, alpha_threshold=0) -> tuple | None:
+    """
+    Bounding Box of the Pixels above an Alpha Threshold
+
+    :param f: Image Filename, RawImage, `.npy` Filename or Array
+    :param alpha_threshold: Ignore Pixels with Alpha at or below (int)
+    :return: tuple(Left, Upper, Right, Lower) or None if Nothing is Visible
+    """
+    return _bbox(load_pixels(f), alpha_threshold)
+
+
+def _semi(alpha: np.ndarray) -> np.ndarray:
+    # Translucent handling never applies to fully transparent or opaque pixels
+    return (alpha > 0) & (alpha < 255)
+
+
+def _visible(alpha: np.ndarray, alpha_threshold=0, translucent="keep") -> np.ndarray:
+    visible = alpha > alpha_threshold
+    if translucent == "skip":
+        visible &= ~_semi(alpha)
+    return visible
+
+
+def _opaque(keys: np.ndarray, semi: np.ndarray) -> np.ndarray:
+    return np.where(semi, keys | _ALPHA, keys)
+
+
+def _check_translucent(translucent: str) -> None:
+    if translucent not in TRANSLUCENT:
+        raise ValueError(f"Unsupported translucent handling `{translucent}`. Must be one of {list(TRANSLUCENT)}")
+
+
+def _unique_packed(pixels, alpha_threshold=0, workers=1, tile_rows=TILE_ROWS, translucent="keep") -> np.ndarray:
+    # Nothing outside the visible bounding box can pass the threshold
+    box = _bbox(pixels, alpha_threshold)
+    if box is None:
+        return np.empty(0, np.uint32)
+
+    left, upper, right, lower = box
+    pixels = pixels[upper:lower, left:right]
+    packed = pack_rgba(pixels)
+
+    def _unique(rows):
+        visible = _visible(pixels[rows, :, 3], alpha_threshold, translucent)
+        keys = packed[rows][visible]
+        return np.unique(_opaque(keys, _semi(pixels[rows, :, 3][visible])) if translucent == "opaque" else keys)
+
+    uniques = map_tiles(_unique, packed.shape[0], workers=workers, tile_rows=tile_rows)
+    return np.unique(np.concatenate(uniques)) if uniques else np.empty(0, np.uint32)
+
+
+def _palette_from_packed(packed: np.ndarray) -> Palette:
+    return Palette(*(Color(*pix) for pix in unpack_rgba(packed).tolist()))
+
+
+def _convert_packed(packed, lut: LookupTable, workers=1, tile_rows=TILE_ROWS, out: np.ndarray = None) -> np.ndarray:
+    converted = np.empty_like(packed) if out is None else out
+
+    def _convert(rows):
+        lut.apply(packed[rows], out=converted[rows])
+
+    map_tiles(_convert, packed.shape[0], workers=workers, tile_rows=tile_rows)
+    return converted
+
+
+class RawImage:
+    """
+    Raw RGBA Pixel File (Height x Width x 4, uint8) for Memory-Mapped I/O
+    """
+
+    def __init__(self, path: str, shape: tuple, offset: int = 0):
+        self.path = path
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.offset = offset
+
+    def open(self, mode="r") -> np.memmap:
+        """
+        Memory-Map the Pixel Buffer
+
+        :param mode: Mapping Mode ("r", "r+", "w+", "c")
+        :return: np.memmap(uint8) of (Height, Width, 4)
+        """
+        return np.memmap(self.path, dtype=np.uint8, mode=mode, offset=self.offset, shape=self.shape + (4,))
+
+
+def _is_mapped(f) -> bool:
+    return isinstance(f, RawImage) or (isinstance(f, str) and f.lower().endswith(".npy"))
+
+
+def _is_encoded(f) -> bool:
+    return not (_is_mapped(f) or isinstance(f, np.ndarray))
+
+
+def _same_target(fa, fb) -> bool:
+    if isinstance(fa, np.ndarray) or isinstance(fb, np.ndarray):
+        return fa is fb
+
+    pa = fa.path if isinstance(fa, RawImage) else fa
+    pb = fb.path if isinstance(fb, RawImage) else fb
+    return os.path.abspath(pa) == os.path.abspath(pb)
+
+
+def _default_output(f_out, f_in):
+    return f_in if isinstance(f_out, str) and f_out == "" else f_out
+
+
+def _output_ext(f_out) -> str:
+    if isinstance(f_out, np.ndarray):
+        return ".array"
+    if isinstance(f_out, RawImage):
+        return ".raw"
+    return os.path.splitext(f_out)[1].lower()
+
+
+def load_pixels(f, mode="r") -> np.ndarray:
+    """
+    Load Pixels of an Image File, Raw RGBA File, `.npy` File or Array
+
+    Raw and `.npy` files are memory-mapped, so they are neither decoded nor copied.
+
+    :param f: Image Filename, RawImage, `.npy` Filename or Array (Height, Width, 4)
+    :param mode: Mapping Mode for Raw and `.npy` Files ("r", "r+", "c")
+    :return: np.ndarray(uint8) of (Height, Width, 4)
+    """
+    if isinstance(f, RawImage):
+        return f.open(mode)
+
+    if isinstance(f, np.ndarray):
+        pixels = f
+    elif _is_mapped(f):
+        pixels = np.load(f, mmap_mode=mode)
+    else:
+        return to_rgba_array(Image.open(f))
+
+    if pixels.dtype != np.uint8 or pixels.ndim != 3 or pixels.shape[-1] != 4:
+        raise ValueError(f"Pixel buffer must be uint8 of shape (Height, Width, 4), got {pixels.dtype} {pixels.shape}")
+    return pixels
+
+
+def _open_output(f_out, shape: tuple) -> np.ndarray:
+    if isinstance(f_out, np.ndarray):
+        if f_out.shape != shape or f_out.dtype != np.uint8:
+            raise ValueError(f"Output array must be uint8 of shape {shape}, got {f_out.dtype} {f_out.shape}")
+        if not f_out.flags.c_contiguous:
+            raise ValueError("Output array must be C-contiguous")
+        return f_out
+
+    if isinstance(f_out, RawImage):
+        if f_out.shape + (4,) != shape:
+            raise ValueError(f"Raw output of shape {f_out.shape} does not match pixels of shape {shape[:2]}")
+        return f_out.open("w+")
+
+    if _is_mapped(f_out):
+        return np.lib.format.open_memmap(f_out, mode="w+", dtype=np.uint8, shape=shape)
+
+    return np.empty(shape, dtype=np.uint8)
+
+
+def _open_io(f_in, f_out):
+    # Raw files and arrays are converted in place when input and output are the same
+    f_out = _default_output(f_out, f_in)
+
+    if not _is_encoded(f_in) and _same_target(f_in, f_out):
+        pixels = load_pixels(f_in, mode="r+")
+        return pixels, pixels, f_out
+
+    return load_pixels(f_in), None, f_out
+
+
+def _store(pixels: np.ndarray, f_out, cache: ConversionCache = None, key: str = None) -> None:
+    if not _is_encoded(f_out):
+        if isinstance(pixels, np.memmap):
+            pixels.flush()
+        if cache is not None:
+            cache.put(key, pixels.tobytes())
+        return
+
+    image = Image.fromarray(np.asarray(pixels))
+    if cache is None:
+        image.save(f_out)
+        return
+
+    buffer = io.BytesIO()
+    image.save(buffer, format=Image.registered_extensions().get(_output_ext(f_out), "PNG"))
+    data = buffer.getvalue()
+
+    cache.put(key, data)
+    with open(f_out, "wb") as f:
+        f.write(data)
+
+
+def _restore(f_out, shape: tuple, cache: ConversionCache = None, key: str = None, out: np.ndarray = None) -> bool:
+    if cache is None:
+        return False
+
+    data = cache.get(key)
+    if data is None:
+        return False
+
+    if _is_encoded(f_out):
+        with open(f_out, "wb") as f:
+            f.write(data)
+        return True
+
+    out = _open_output(f_out, shape) if out is None else out
+    out[...] = np.frombuffer(data, dtype=np.uint8).reshape(shape)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return True
+
+
+def extract_palette_ext(f, alpha_threshold=0, workers=1, tile_rows=TILE_ROWS, translucent="keep") -> Palette:
+    """
+    Extract Palette of Visible Pixels (Only the Opaque Bounding Box is Scanned)
+
+    :param f: Image Filename, RawImage, `.npy` Filename or Array
+    :param alpha_threshold: Ignore Pixels with Alpha at or below (int)
+    :param workers: Number of Threads (int)
+    :param tile_rows: Rows per Tile (int)
+    :param translucent: Semi-Transparent Pixels (0 < Alpha < 255) are Kept as is ("keep"), Ignored ("skip")
+        or Counted as their Opaque Color ("opaque")
+    :return: Palette
+    """
+    _check_translucent(translucent)
+    pixels = load_pixels(f)
+    return _palette_from_packed(_unique_packed(pixels, alpha_threshold, workers, tile_rows, translucent=translucent))
+
+
+class PaletteEstimate:
+    """
+    Approximate Palette from a Pixel Sample (Colors Ordered by Estimated Frequency)
+    """
+
+    def __init__(self, colors: List[Color], counts: np.ndarray, sample_size: int, image_size: tuple):
+        self.colors = colors
+        self.counts = counts
+        self.sample_size = sample_size
+        self.image_size = image_size
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """
+        Estimated Share of Visible Pixels per Color
+
+        :return: np.ndarray(float64)
+        """
+        return self.counts / max(self.sample_size, 1)
+
+    @property
+    def stderr(self) -> np.ndarray:
+        """
+        Standard Error of each Estimated Frequency
+
+        :return: np.ndarray(float64)
+        """
+        p = self.frequencies
+        return np.sqrt(p * (1 - p) / max(self.sample_size, 1))
+
+    def error_bound(self, confidence=0.95) -> float:
+        """
+        Hoeffding Bound on the Absolute Frequency Error of any Single Color
+
+        Holds for random sampling, and is a heuristic for stride sampling.
+
+        :param confidence: Confidence Level (float)
+        :return: float
+        """
+        if self.sample_size == 0:
+            return 1.0
+        return math.sqrt(math.log(2 / (1 - confidence)) / (2 * self.sample_size))
+
+    def to_palette(self) -> Palette:
+        """
+        Returns a Palette Object of the Sampled Colors
+
+        :return: Palette
+        """
+        return Palette(*self.colors)
+
+    def __iter__(self):
+        return iter(self.colors)
+
+    def __len__(self):
+        return len(self.colors)
+
+
+def extract_palette_sample(f, k=16, sample_size=65536, method="random", seed=0,
+                           alpha_threshold=0) -> PaletteEstimate:
+    """
+    Approximate Top-k Palette from a Pixel Sample, so the Cost Depends on the Sample Size
+
+    Encoded images let the decoder downscale (JPEG draft mode) to about the resolution the
+    sample needs before any pixel is read. Other formats and arrays are read in full.
+
+    :param f: Image Filename, RawImage, `.npy` Filename or Array
+    :param k: Number of Most Frequent Colors (int)
+    :param sample_size: Number of Pixels to Sample (int)
+    :param method: "random" (Uniform with Replacement) or "stride" (Regular Grid of at most `sample_size` Pixels)
+    :param seed: Random Seed, the Same Seed gives the Same Estimate (int)
+    :param alpha_threshold: Ignore Sampled Pixels with Alpha at or below (int)
+    :return: PaletteEstimate
+    """
+    if method not in ("random", "stride"):
+        raise ValueError(f'Unsupported method `{method}`. Must be one of ["random", "stride"]')
+
+    if _is_encoded(f):
+        image = Image.open(f)
+        width, height = image.size
+
+        # Let the decoder downscale (JPEG) to roughly the resolution the sample needs
+        scale = math.sqrt(width * height / max(sample_size, 1))
+        if scale > 1:
+            image.draft("RGB", (math.ceil(width / scale), math.ceil(height / scale)))
+        pixels = to_rgba_array(image)
+    else:
+        pixels = load_pixels(f)
+        height, width = pixels.shape[:2]
+
+    packed = pack_rgba(pixels)
+    n_pixels = packed.size
+
+    if method == "stride":
+        stride = max(1, math.ceil(math.sqrt(n_pixels / max(sample_size, 1))))
+        sample = packed[::stride, ::stride].ravel()
+    else:
+        rng = np.random.default_rng(seed)
+        sample = packed.ravel()[rng.integers(0, n_pixels, min(sample_size, n_pixels))]
+
+    sample = sample[unpack_rgba(sample)[:, 3] > alpha_threshold]
+    values, counts = np.unique(sample, return_counts=True)
+
+    top = np.argsort(-counts, kind="stable")[:k]
+    colors = [Color(*pix) for pix in unpack_rgba(values[top]).tolist()]
+
+    return PaletteEstimate(colors, counts[top], len(sample), (width, height))
 
 
 def export_palette(palette, f, size=(8, 8)) -> None:
@@ -48,40 +405,756 @@ def export_palette(palette, f, size=(8, 8)) -> None:
     return
 
 
-def convert_palette(f_in, cmap: ConversionPalette | dict = None, f_out="") -> None:
+class ConversionStats:
+    """
+    Per-Color Coverage of one Conversion as Packed RGBA (uint32) Arrays with Pixel Counts
+
+    - sources / source_counts     : Lookup Table Keys and the Pixels Converted by each
+    - unmapped / unmapped_counts  : Visible Colors Missing from the Table (Passed Through)
+    - transparent                 : Other Pixels with Alpha at or below the Threshold (0 by Default)
+    - skipped                     : Semi-Transparent Pixels Left Unchanged (translucent="skip")
+    """
+
+    def __init__(self, sources: np.ndarray, source_counts: np.ndarray, values: np.ndarray, unmapped: np.ndarray,
+                 unmapped_counts: np.ndarray, transparent: int, skipped: int, pixels: int):
+        self.sources = sources
+        self.source_counts = source_counts
+        self.values = values
+        self.unmapped = unmapped
+        self.unmapped_counts = unmapped_counts
+        self.transparent = transparent
+        self.skipped = skipped
+        self.pixels = pixels
+
+    @classmethod
+    def _merge(cls, lut: LookupTable, tallies: list, transparent: int, pixels: int) -> ConversionStats:
+        counts = np.zeros(len(lut), dtype=np.int64)
+        for tally in tallies:
+            counts += tally[0]
+
+        unmapped = np.concatenate([t[1] for t in tallies] or [np.empty(0, np.uint32)])
+        weights = np.concatenate([t[2] for t in tallies] or [np.empty(0, np.int64)])
+        unmapped, index = np.unique(unmapped, return_inverse=True)
+        unmapped_counts = np.bincount(index.reshape(-1), weights=weights, minlength=len(unmapped)).astype(np.int64)
+
+        transparent += sum(t[3] for t in tallies)
+        skipped = sum(t[4] for t in tallies)
+        return cls(lut.keys, counts, lut.values, unmapped, unmapped_counts, transparent, skipped, pixels)
+
+    @property
+    def targets(self) -> np.ndarray:
+        """
+        Distinct Target Colors (Packed RGBA)
+
+        :return: np.ndarray(uint32)
+        """
+        return np.unique(self.values)
+
+    @property
+    def target_counts(self) -> np.ndarray:
+        """
+        Converted Pixels per Target Color (in `targets` Order)
+
+        :return: np.ndarray(int64)
+        """
+        targets, index = np.unique(self.values, return_inverse=True)
+        return np.bincount(index.reshape(-1), weights=self.source_counts, minlength=len(targets)).astype(np.int64)
+
+    @property
+    def mapped(self) -> int:
+        return int(self.source_counts.sum())
+
+    @property
+    def unused(self) -> np.ndarray:
+        """
+        Table Keys that no Pixel Matched (Packed RGBA)
+
+        :return: np.ndarray(uint32)
+        """
+        return self.sources[self.source_counts == 0]
+
+    def unmapped_colors(self) -> List[Color]:
+        """
+        Colors Missing from the Conversion Palette, Most Frequent First
+
+        :return: list(Color)
+        """
+        order = np.argsort(-self.unmapped_counts, kind="stable")
+        return [Color(*pix) for pix in unpack_rgba(self.unmapped[order]).tolist()]
+
+    def to_dict(self) -> dict:
+        return {
+            "pixels": self.pixels,
+            "mapped": self.mapped,
+            "unmapped": int(self.unmapped_counts.sum()),
+            "unmapped_colors": len(self.unmapped),
+            "unused_entries": len(self.unused),
+            "transparent": self.transparent,
+            "skipped": self.skipped,
+        }
+
+
+def _convert_sparse(pixels, lut: LookupTable, out: np.ndarray, alpha_threshold=0, translucent="keep", workers=1,
+                    tile_rows=TILE_ROWS, stats=False) -> ConversionStats | None:
+    # Only the visible bounding box is searched, every other pixel is copied as is
+    if out is not pixels:
+        np.copyto(out, pixels)
+
+    height, width = pixels.shape[:2]
+    box = _bbox(pixels, alpha_threshold)
+    if box is None:
+        return ConversionStats._merge(lut, [], height * width, height * width) if stats else None
+
+    left, upper, right, lower = box
+    src = pack_rgba(pixels)[upper:lower, left:right]
+    dst = pack_rgba(out, view=True)[upper:lower, left:right]
+    alpha = pixels[upper:lower, left:right, 3]
+
+    # Unconverted pixels at or below the floor count as transparent
+    floor = max(alpha_threshold, 0)
+
+    def _convert(rows):
+        visible = _visible(alpha[rows], alpha_threshold, translucent)
+        everything = visible.all()
+
+        keys = src[rows] if everything else src[rows][visible]
+        if translucent == "opaque":
+            semi = _semi(alpha[rows] if everything else alpha[rows][visible])
+            lookup = _opaque(keys, semi)
+        else:
+            lookup = keys
+        idx, hit = lut.match(lookup)
+
+        values = np.where(hit, lut.values[idx], lookup) if len(lut) else lookup
+        if translucent == "opaque":
+            # Keep the pixel's own alpha
+            values = np.where(semi, (values & ~_ALPHA) | (keys & _ALPHA), values)
+
+        if everything:
+            dst[rows] = values
+        elif len(keys):
+            tile = dst[rows]
+            tile[visible] = values
+
+        if not stats:
+            return None
+
+        a = alpha[rows]
+        above = (a if everything else a[visible]) > floor
+        missed, missed_counts = np.unique(keys[~hit & above], return_counts=True)
+        transparent = int(np.count_nonzero(a <= floor)) - int(np.count_nonzero(hit & ~above))
+        skipped = int(np.count_nonzero(~visible & (a > floor)))
+        return np.bincount(idx[hit], minlength=len(lut)), missed, missed_counts, transparent, skipped
+
+    tallies = map_tiles(_convert, lower - upper, workers=workers, tile_rows=tile_rows)
+    if not stats:
+        return None
+
+    outside = height * width - (lower - upper) * (right - left)
+    return ConversionStats._merge(lut, tallies, outside, height * width)
+
+
+def convert_palette(f_in, cmap: ConversionPalette | dict = None, f_out="", workers=1, tile_rows=TILE_ROWS,
+                    cache: ConversionCache = None, alpha_threshold=None, translucent="keep",
+                    stats=False) -> ConversionStats | None:
+    """
+    Convert Image Colors through a Conversion Palette
+
+    Fully transparent regions are skipped whenever the palette does not map any
+    fully transparent color, so the cost follows the visible content.
+
+    :param f_in: Input Image Filename, RawImage, `.npy` Filename or Array
+    :param cmap: ConversionPalette, Dict, LookupTable or List of Conversion Palettes Composed in Order
+    :param f_out: Output Target of the Same Kinds (Input if Empty)
+    :param workers: Number of Threads (int)
+    :param tile_rows: Rows per Tile (int)
+    :param cache: ConversionCache Object (With `stats` the Result is Stored but a Cached Result is never Used,
+        since the Statistics need the Counting Pass)
+    :param alpha_threshold: Leave Pixels with Alpha at or below Unchanged (int), None to Convert every Pixel
+    :param translucent: Semi-Transparent Pixels (0 < Alpha < 255) are Converted as is ("keep"), Left Unchanged ("skip")
+        or Converted as their Opaque Color Keeping their Alpha ("opaque")
+    :param stats: Gather Per-Color Coverage in the Same Pass (bool)
+    :return: ConversionStats if `stats`, otherwise None
+    """
     if cmap is None:
-        return
+        return None
 
-    if isinstance(cmap, ConversionPalette):
-        cmap = cmap.to_dict()
+    _check_translucent(translucent)
+    lut = LookupTable.from_cmap(cmap)
+    pixels, out, f_out = _open_io(f_in, f_out)
 
-    f_image = Image.open(f_in)
-    f_image = f_image.convert("RGBA")
+    key = None
+    if cache is not None:
+        key = cache.key(pixels, lut.keys, lut.values, fn=convert_palette.__name__, ext=_output_ext(f_out),
+                        alpha_threshold=alpha_threshold, translucent=translucent)
+        if not stats and _restore(f_out, pixels.shape, cache, key, out=out):
+            return None
+
+    out = _open_output(f_out, pixels.shape) if out is None else out
+
+    if alpha_threshold is None and not np.any((lut.keys & _ALPHA) == 0):
+        # Fully transparent pixels would pass through the table unchanged anyway
+        alpha_threshold = 0
+
+    result = None
+    if alpha_threshold is None and translucent == "keep" and not stats:
+        _convert_packed(pack_rgba(pixels), lut, workers=workers, tile_rows=tile_rows, out=pack_rgba(out, view=True))
+    else:
+        threshold = -1 if alpha_threshold is None else alpha_threshold
+        result = _convert_sparse(pixels, lut, out, threshold, translucent, workers=workers, tile_rows=tile_rows,
+                                 stats=stats)
 
-    new_image = Image.new("RGBA", f_image.size)
-    for x in range(f_image.width):
-        for y in range(f_image.height):
-            pix = f_image.getpixel((x, y))
+    _store(out, f_out, cache, key)
+    return result
 
-            if pix in cmap:
-                new_pix = cmap[pix]
-            else:
-                new_pix = pix
-            new_image.putpixel((x, y), new_pix)
 
-    f_out = f_out if f_out != "" else f_in
-    new_image.save(f_out)
+def gradient_map(f_in, colors: Palette | list, f_out="", space="rgb", smooth=True, workers=1, tile_rows=TILE_ROWS,
+                 cache: ConversionCache = None) -> None:
+    """
+    Recolor an Image by Lightness onto an Ordered Ramp (Darkest Color First)
+
+    Every pixel indexes a 256-level table with its `Color.to_lightness` value, so the
+    cost does not depend on the number of unique colors. Alpha is the pixel alpha
+    scaled by the ramp alpha.
+
+    :param f_in: Input Image
+    :param colors: Ordered List of Colors (Ramp Stops), Palettes are Sorted Darkest First
+    :param f_out: Output Image
+    :param space: Interpolation Space ("rgb", "hsl", "hsv", "oklab")
+    :param smooth: Interpolate between Colors, otherwise Map to the Colors only (bool)
+    :param workers: Number of Threads (int)
+    :param tile_rows: Rows per Tile (int)
+    :param cache: ConversionCache Object
+    :return:
+    """
+    table = gradient_table(colors, space=space, smooth=smooth)
+    rgb, alpha = table[:, :3], table[:, 3].astype(np.uint32)
+    pixels, out, f_out = _open_io(f_in, f_out)
+
+    key = None
+    if cache is not None:
+        key = cache.key(pixels, table, fn=gradient_map.__name__, ext=_output_ext(f_out))
+        if _restore(f_out, pixels.shape, cache, key, out=out):
+            return
+
+    out = _open_output(f_out, pixels.shape) if out is None else out
+
+    def _gradient(rows):
+        src = pixels[rows].astype(np.uint32)
+        # Fixed-point `to_lightness` (weights scaled to 2 ** 16), rounded to a level
+        level = (13933 * src[..., 0] + 46871 * src[..., 1] + 4732 * src[..., 2] + 32768) >> 16
+        out[rows, :, :3] = rgb[level]
+        out[rows, :, 3] = (src[..., 3] * alpha[level] + 127) // 255
+
+    map_tiles(_gradient, pixels.shape[0], workers=workers, tile_rows=tile_rows)
+    _store(out, f_out, cache, key)
     return
 
 
-def extract_convert_palette(f_a: str, f_b: str, f_out="", method="min_distance") -> None:
-    pa = extract_palette_ext(f_a)
-    pb = extract_palette_ext(f_b)
+def _few_colors(packed: np.ndarray, limit: int, sample_size=65536) -> bool:
+    # A stride sample with many colors rules the table out without a full `np.unique`
+    flat = packed.reshape(-1)
+    step = max(flat.size // sample_size, 1)
+    return len(np.unique(flat[::step])) <= limit
+
+
+def adjust_image(f_in, f_out="", hue=0.0, saturation=1.0, lightness=1.0, space="hsl", method="auto", workers=1,
+                 tile_rows=TILE_ROWS, cache: ConversionCache = None) -> None:
+    """
+    Shift Hue and Scale Saturation and Lightness (Value for HSV) of a whole Image
+
+    With few unique colors only the unique-color table is adjusted and pixels are
+    remapped through a LookupTable, otherwise every pixel is adjusted per tile.
+
+    :param f_in: Input Image
+    :param f_out: Output Image
+    :param hue: Hue Shift in Degrees (float)
+    :param saturation: Saturation Factor (float)
+    :param lightness: Lightness or Value Factor (float)
+    :param space: Adjustment Space ("hsl", "hsv")
+    :param method: "auto", "table" (Unique Colors) or "pixels" (str)
+    :param workers: Number of Threads (int)
+    :param tile_rows: Rows per Tile (int)
+    :param cache: ConversionCache Object
+    :return:
+    """
+    if method not in ("auto", "table", "pixels"):
+        raise ValueError(f'Unsupported method `{method}`. Must be one of ["auto", "table", "pixels"]')
+
+    pixels, out, f_out = _open_io(f_in, f_out)
+    packed = pack_rgba(pixels)
+
+    key = None
+    if cache is not None:
+        key = cache.key(pixels, fn=adjust_image.__name__, ext=_output_ext(f_out), hue=float(hue),
+                        saturation=float(saturation), lightness=float(lightness), space=space)
+        if _restore(f_out, pixels.shape, cache, key, out=out):
+            return
+
+    out = _open_output(f_out, pixels.shape) if out is None else out
+
+    if method == "table" or (method == "auto" and _few_colors(packed, TABLE_COLORS)):
+        keys = _unique_packed(pixels, alpha_threshold=-1, workers=workers, tile_rows=tile_rows)
+        values = pack_rgba(adjust_array(unpack_rgba(keys), hue, saturation, lightness, space=space))
+        _convert_packed(packed, LookupTable(keys, values), workers=workers, tile_rows=tile_rows,
+                        out=pack_rgba(out, view=True))
+    else:
+        def _adjust(rows):
+            out[rows] = adjust_array(pixels[rows], hue, saturation, lightness, space=space)
+
+        map_tiles(_adjust, pixels.shape[0], workers=workers, tile_rows=tile_rows)
+
+    _store(out, f_out, cache, key)
+    return
+
+
+def simulate_cvd_image(f_in, deficiency: str, f_out="", severity=1.0, workers=1, tile_rows=TILE_ROWS,
+                       cache: ConversionCache = None) -> None:
+    """
+    Simulate Color Vision Deficiency on a whole Image
+
+    :param f_in: Input Image
+    :param deficiency: "protanopia", "deuteranopia", "tritanopia" or "achromatopsia"
+    :param f_out: Output Image
+    :param severity: 0 (Normal Vision) - 1 (Full Deficiency) (float)
+    :param workers: Number of Threads (int)
+    :param tile_rows: Rows per Tile (int)
+    :param cache: ConversionCache Object
+    :return:
+    """
+    cvd_matrix(deficiency, severity)
+    pixels, out, f_out = _open_io(f_in, f_out)
+
+    key = None
+    if cache is not None:
+        key = cache.key(pixels, fn=simulate_cvd_image.__name__, ext=_output_ext(f_out), deficiency=deficiency,
+                        severity=float(severity))
+        if _restore(f_out, pixels.shape, cache, key, out=out):
+            return
+
+    out = _open_output(f_out, pixels.shape) if out is None else out
+
+    def _simulate(rows):
+        out[rows] = simulate_cvd(pixels[rows], deficiency, severity)
+
+    map_tiles(_simulate, pixels.shape[0], workers=workers, tile_rows=tile_rows)
+    _store(out, f_out, cache, key)
+    return
+
+
+class IndexedImage:
+    """
+    Image Decomposed into an Index Image and its Unique-Color Table (Sorted Packed RGBA)
+
+    Indices use the smallest unsigned type that fits the table, so remapping only
+    touches the table and expanding is one bulk take per tile.
+    """
+
+    def __init__(self, indices: np.ndarray, colors: np.ndarray):
+        colors = np.asarray(colors, dtype=np.uint32).ravel()
+        indices = np.asarray(indices)
+
+        if indices.ndim != 2 or indices.dtype.kind != "u":
+            raise ValueError(f"Indices must be unsigned integers of shape (Height, Width), got {indices.dtype} "
+                             f"{indices.shape}")
+        if indices.size and int(indices.max()) >= len(colors):
+            raise ValueError(f"Indices point past the color table of {len(colors)} colors")
+
+        self.indices = indices
+        self.colors = colors
+
+    @staticmethod
+    def _index_dtype(size: int) -> np.dtype:
+        for dtype in (np.uint8, np.uint16):
+            if size <= np.iinfo(dtype).max + 1:
+                return np.dtype(dtype)
+        return np.dtype(np.uint32)
+
+    @classmethod
+    def from_image(cls, f, workers=1, tile_rows=TILE_ROWS) -> IndexedImage:
+        """
+        Decompose an Image (One Full Pass)
+
+        :param f: Image Filename, RawImage, `.npy` Filename or Array
+        :param workers: Number of Threads (int)
+        :param tile_rows: Rows per Tile (int)
+        :return: IndexedImage
+        """
+        pixels = load_pixels(f)
+        colors = _unique_packed(pixels, alpha_threshold=-1, workers=workers, tile_rows=tile_rows)
+        packed = pack_rgba(pixels)
+        indices = np.empty(packed.shape, dtype=cls._index_dtype(len(colors)))
+
+        def _index(rows):
+            indices[rows] = np.searchsorted(colors, packed[rows])
+
+        map_tiles(_index, packed.shape[0], workers=workers, tile_rows=tile_rows)
+        return cls(indices, colors)
+
+    @property
+    def shape(self) -> tuple:
+        return self.indices.shape + (4,)
+
+    def to_palette(self, alpha_threshold=0) -> Palette:
+        """
+        Returns a Palette Object of the Color Table
+
+        :param alpha_threshold: Ignore Colors with Alpha at or below (int)
+        :return: Palette
+        """
+        return _palette_from_packed(self.colors[unpack_rgba(self.colors)[:, 3] > alpha_threshold])
+
+    def counts(self) -> np.ndarray:
+        """
+        Pixels per Table Color
+
+        :return: np.ndarray(int64)
+        """
+        return np.bincount(self.indices.ravel(), minlength=len(self.colors))
+
+    def remap(self, cmap: ConversionPalette | dict) -> IndexedImage:
+        """
+        Convert the Color Table only (Indices are Shared, not Copied)
+
+        :param cmap: ConversionPalette, Dict, LookupTable or List of Conversion Palettes Composed in Order
+        :return: IndexedImage
+        """
+        remapped = IndexedImage.__new__(IndexedImage)
+        remapped.indices = self.indices
+        remapped.colors = LookupTable.from_cmap(cmap).apply(self.colors)
+        return remapped
+
+    def to_pixels(self, out: np.ndarray = None, workers=1, tile_rows=TILE_ROWS) -> np.ndarray:
+        """
+        Expand Indices into RGBA Pixels
+
+        :param out: Output Array (uint8) of (Height, Width, 4)
+        :param workers: Number of Threads (int)
+        :param tile_rows: Rows per Tile (int)
+        :return: np.ndarray(uint8) of (Height, Width, 4)
+        """
+        out = np.empty(self.shape, dtype=np.uint8) if out is None else _open_output(out, self.shape)
+        packed = pack_rgba(out, view=True)
+
+        def _expand(rows):
+            # Indices are checked against the table on construction
+            np.take(self.colors, self.indices[rows], out=packed[rows], mode="clip")
+
+        map_tiles(_expand, self.indices.shape[0], workers=workers, tile_rows=tile_rows)
+        return out
+
+    def convert(self, cmap: ConversionPalette | dict, f_out, workers=1, tile_rows=TILE_ROWS) -> None:
+        """
+        Write the Image Converted through a Conversion Palette
+
+        :param cmap: ConversionPalette, Dict, LookupTable or List of Conversion Palettes Composed in Order
+            (None Writes the Image as is)
+        :param f_out: Output Image Filename, RawImage, `.npy` Filename or Array
+        :param workers: Number of Threads (int)
+        :param tile_rows: Rows per Tile (int)
+        :return:
+        """
+        image = self if cmap is None else self.remap(cmap)
+        out = image.to_pixels(_open_output(f_out, self.shape), workers=workers, tile_rows=tile_rows)
+        _store(out, f_out)
+
+    def save(self, f: str) -> None:
+        """
+        Store Indices and Color Table Compressed (`.npz`)
+
+        :param f: Filename
+        :return:
+        """
+        np.savez_compressed(f, indices=self.indices, colors=self.colors)
+
+    @classmethod
+    def load(cls, f: str) -> IndexedImage:
+        """
+        Load Indices and Color Table Stored by `save`
+
+        :param f: Filename
+        :return: IndexedImage
+        """
+        with np.load(f) as data:
+            return cls(data["indices"], data["colors"])
+
+    def __len__(self):
+        return len(self.colors)
+
 
-    if method == "min_distance":
-        cmap = ConversionPalette.map(pa, pb)
+class TileDedup:
+    """
+    Tile Deduplication Report (Tiles in the Image and Unique Tiles Converted)
+    """
+
+    def __init__(self, tiles: int, unique_tiles: int, tile_size: tuple):
+        self.tiles = tiles
+        self.unique_tiles = unique_tiles
+        self.tile_size = tile_size
+
+    @property
+    def ratio(self) -> float:
+        """
+        Deduplication Ratio (Tiles per Unique Tile)
+
+        :return: float
+        """
+        return self.tiles / max(self.unique_tiles, 1)
+
+    def __str__(self):
+        tile_w, tile_h = self.tile_size
+        return f"{self.unique_tiles}/{self.tiles} unique {tile_w}x{tile_h} tiles ({self.ratio:.2f}x)"
+
+
+def _split_tiles(packed: np.ndarray, tile_w: int, tile_h: int) -> np.ndarray:
+    height, width = packed.shape
+    rows, cols = -(-height // tile_h), -(-width // tile_w)
+
+    padded = np.zeros((rows * tile_h, cols * tile_w), dtype=np.uint32)
+    padded[:height, :width] = packed
+    return padded.reshape(rows, tile_h, cols, tile_w).transpose(0, 2, 1, 3).reshape(rows * cols, tile_h * tile_w)
+
+
+def _join_tiles(tiles: np.ndarray, shape: tuple, tile_w: int, tile_h: int) -> np.ndarray:
+    height, width = shape
+    rows, cols = -(-height // tile_h), -(-width // tile_w)
+
+    joined = tiles.reshape(rows, cols, tile_h, tile_w).transpose(0, 2, 1, 3).reshape(rows * tile_h, cols * tile_w)
+    return joined[:height, :width]
+
+
+def _dedup_tiles(tiles: np.ndarray):
+    # Hash every tile with random odd multipliers (wrapping uint64), then verify the
+    # grouping against the tiles themselves and fall back to exact row comparison
+    multipliers = np.random.default_rng(0x9E3779B9).integers(1, 2 ** 63, tiles.shape[1], dtype=np.uint64) | 1
+    hashes = (tiles.astype(np.uint64) * multipliers).sum(axis=1, dtype=np.uint64)
+
+    _, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+    unique = tiles[first]
+    if np.array_equal(unique[inverse.ravel()], tiles):
+        return unique, inverse.ravel()
+
+    unique, inverse = np.unique(tiles, axis=0, return_inverse=True)
+    return unique, inverse.ravel()
+
+
+def convert_palette_dedup(f_in, cmap: ConversionPalette | dict = None, f_out="", tile_size=8) -> TileDedup | None:
+    """
+    Convert Palette Converting each Unique Tile Once and Copying it to every Occurrence
+
+    :param f_in: Input Image Filename, RawImage, `.npy` Filename or Array
+    :param cmap: LookupTable, ConversionPalette Object or Dict
+    :param f_out: Output Target of the Same Kinds (Input if Empty)
+    :param tile_size: Tile Size as int or (Width, Height)
+    :return: TileDedup, None (Nothing is Written) without `cmap`
+    """
+    tile_w, tile_h = (tile_size, tile_size) if isinstance(tile_size, int) else tile_size
+    if tile_w < 1 or tile_h < 1:
+        raise ValueError(f"Tile size must be positive, got {tile_size}")
+
+    if cmap is None:
+        return None
+
+    lut = LookupTable.from_cmap(cmap)
+    pixels, out, f_out = _open_io(f_in, f_out)
+    packed = pack_rgba(pixels)
+
+    tiles = _split_tiles(packed, tile_w, tile_h)
+    unique, inverse = _dedup_tiles(tiles)
+    converted = lut.apply(unique)[inverse]
+
+    out = _open_output(f_out, pixels.shape) if out is None else out
+    pack_rgba(out, view=True)[...] = _join_tiles(converted, packed.shape, tile_w, tile_h)
+    _store(out, f_out)
+
+    return TileDedup(len(tiles), len(unique), (tile_w, tile_h))
+
+
+_DONE = object()
+_STOP = object()
+
+
+def _run_stage(fn, inbox: queue.Queue, outbox: queue.Queue, threads: int, upstream: int, errors: list) -> list:
+    # Every upstream thread sends one `_DONE` when it exits. The thread that receives the
+    # last one stops its siblings, and every thread of this stage sends `_DONE` downstream.
+    state = {"done": 0}
+    lock = threading.Lock()
+
+    def _worker():
+        try:
+            while True:
+                item = inbox.get()
+                if item is _STOP:
+                    return
+
+                if item is _DONE:
+                    with lock:
+                        state["done"] += 1
+                        last = state["done"] == upstream
+                    if last:
+                        for _ in range(threads - 1):
+                            inbox.put(_STOP)
+                        return
+                    continue
+
+                idx, payload = item
+                try:
+                    result = fn(*payload)
+                except Exception as e:
+                    errors[idx] = e
+                    continue
+
+                if outbox is not None:
+                    outbox.put((idx, result))
+        finally:
+            if outbox is not None:
+                outbox.put(_DONE)
+
+    workers = [threading.Thread(target=_worker, daemon=True) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def convert_batch(jobs: list, cmap: ConversionPalette | dict, decoders=1, encoders=2, workers=1,
+                  queue_size=4) -> list:
+    """
+    Convert Many Images through Pipelined Decode, Remap and Encode Stages
+
+    Stages run on their own threads and are connected by bounded queues, so a slow
+    stage applies backpressure instead of buffering every decoded image.
+
+    :param jobs: List of Input or (Input, Output) (Filename, RawImage, `.npy` Filename or Array)
+    :param cmap: LookupTable, ConversionPalette Object or Dict
+    :param decoders: Decoder Threads (int)
+    :param encoders: Encoder Threads (int)
+    :param workers: Tile Threads used by the Remap Stage (int)
+    :param queue_size: Capacity of each Queue between Stages (int)
+    :return: list (None or Exception per Job)
+    """
+    lut = LookupTable.from_cmap(cmap)
+    jobs = [job if isinstance(job, tuple) else (job, "") for job in jobs]
+    errors = [None] * len(jobs)
+
+    pending, decoded, remapped = queue.Queue(), queue.Queue(queue_size), queue.Queue(queue_size)
+
+    def _decode(f_in, f_out):
+        return _open_io(f_in, f_out)
+
+    def _remap(pixels, out, f_out):
+        out = _open_output(f_out, pixels.shape) if out is None else out
+        _convert_packed(pack_rgba(pixels), lut, workers=workers, out=pack_rgba(out, view=True))
+        return out, f_out
+
+    def _encode(out, f_out):
+        _store(out, f_out)
+
+    threads = [
+        *_run_stage(_decode, pending, decoded, decoders, 1, errors),
+        *_run_stage(_remap, decoded, remapped, 1, decoders, errors),
+        *_run_stage(_encode, remapped, None, encoders, 1, errors),
+    ]
+
+    for idx, job in enumerate(jobs):
+        pending.put((idx, job))
+    pending.put(_DONE)
+
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def _label_array(mask, size: tuple) -> np.ndarray:
+    if isinstance(mask, str):
+        mask = Image.open(mask)
+
+    if isinstance(mask, Image.Image):
+        if mask.mode not in ("L", "P", "I"):
+            mask = mask.convert("L")
+        mask = np.asarray(mask)
+
+    mask = np.asarray(mask)
+    if mask.shape != (size[1], size[0]):
+        raise ValueError(f"Label mask of shape {mask.shape} does not match image size {size}")
+    return mask
+
+
+def convert_regions(f_in, regions: list = None, f_out="", mask=None, cmaps: dict = None) -> None:
+    """
+    Convert Regions of one Image with their own Conversion Palettes in a Single Pass
+
+    Regions are remapped from the source pixels, so overlapping boxes do not chain;
+    later boxes win where they overlap. Pixels outside every region are unchanged.
+
+    :param f_in: Input Image Filename, RawImage, `.npy` Filename or Array
+    :param regions: List of (Box (Left, Upper, Right, Lower), ConversionPalette | dict)
+    :param f_out: Output Target of the Same Kinds (Input if Empty)
+    :param mask: Label Mask (Filename, PIL Image or Array of Height x Width)
+    :param cmaps: Dict of {Label : ConversionPalette | dict} for the Label Mask
+    :return:
+    """
+    pixels, out, f_out = _open_io(f_in, f_out)
+    height, width = pixels.shape[:2]
+
+    packed = pack_rgba(pixels)
+    if out is None:
+        out = _open_output(f_out, pixels.shape)
+        np.copyto(out, pixels)
     else:
-        raise NotImplemented(f"Unable to run {extract_convert_palette.__name__} with method `{method}`.")
+        # Converting in place, keep a copy of the source so that regions do not chain
+        packed = packed.copy()
+    converted = pack_rgba(out, view=True)
+
+    for box, cmap in regions or []:
+        left, upper, right, lower = (int(v) for v in box)
+        if not (0 <= left <= right <= width and 0 <= upper <= lower <= height):
+            raise ValueError(f"Region box {box} is outside of image size {(width, height)}")
+
+        rows, cols = slice(upper, lower), slice(left, right)
+        LookupTable.from_cmap(cmap).apply(packed[rows, cols], out=converted[rows, cols])
+
+    if mask is not None and cmaps:
+        labels = _label_array(mask, (width, height)).ravel()
+        src, dst = packed.ravel(), converted.ravel()
+
+        # Group pixel indices by label once, then remap every group in bulk
+        order = np.argsort(labels, kind="stable")
+        sorted_labels = labels[order]
+        for label, cmap in cmaps.items():
+            start = np.searchsorted(sorted_labels, label, side="left")
+            end = np.searchsorted(sorted_labels, label, side="right")
+            if start == end:
+                continue
+            idx = order[start:end]
+            dst[idx] = LookupTable.from_cmap(cmap).apply(src[idx])
+
+    _store(out, f_out)
+    return
+
+
+def extract_convert_palette(f_a, f_b, f_out="", method="min_distance", workers=1,
+                            cache: ConversionCache = None) -> None:
+    if method != "min_distance":
+        raise ValueError(f'Unsupported method `{method}`. Must be one of ["min_distance"]')
+
+    pixels_a, out, f_out = _open_io(f_a, f_out)
+    pixels_b = load_pixels(f_b)
+
+    packed_b = _unique_packed(pixels_b, workers=workers)
+
+    key = None
+    if cache is not None:
+        key = cache.key(pixels_a, packed_b, fn=extract_convert_palette.__name__, method=method,
+                        ext=_output_ext(f_out))
+        if _restore(f_out, pixels_a.shape, cache, key, out=out):
+            return
+
+    pa = _palette_from_packed(_unique_packed(pixels_a, workers=workers))
+    pb = _palette_from_packed(packed_b)
+
+    cmap = ConversionPalette.map(pa, pb)
 
-    convert_palette(f_a, cmap, f_out=f_out)
+    out = _open_output(f_out, pixels_a.shape) if out is None else out
+    _convert_packed(pack_rgba(pixels_a), LookupTable.from_cmap(cmap), workers=workers, out=pack_rgba(out, view=True))
+    _store(out, f_out, cache, key)
     return
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from paleta.array import BATCH_ELEMENTS, colors_to_array, pack_rgba
+from paleta.palette import Palette, FrozenPalette, ConversionPalette
+
+
+class LookupTable:
+    """
+    Compiled Color Lookup Table (Sorted Packed RGBA Keys -> Packed RGBA Values)
+
+    Pixels that are not in the table are passed through unchanged.
+    """
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray):
+        keys = np.asarray(keys, dtype=np.uint32).ravel()
+        values = np.asarray(values, dtype=np.uint32).ravel()
+
+        if keys.shape != values.shape:
+            raise ValueError(f"Keys and values must have the same length, got {len(keys)} and {len(values)}")
+
+        keys, index = np.unique(keys, return_index=True)
+        self.keys = keys
+        self.values = values[index]
+
+    @classmethod
+    def from_cmap(cls, cmap: ConversionPalette | dict):
+        """
+        Compile Lookup Table from Conversion Palette or Dict
+
+        :param cmap: LookupTable, ConversionPalette Object, Dict {(R, G, B, A): (R, G, B, A)}
+            or List of ConversionPalette / Dict Composed in Order
+        :return: cls
+        """
+        if isinstance(cmap, LookupTable):
+            return cmap
+
+        if isinstance(cmap, (list, tuple)):
+            cmap = ConversionPalette().compose(*cmap)
+
+        if isinstance(cmap, ConversionPalette):
+            cmap = cmap.to_dict()
+
+        if not cmap:
+            return cls(np.empty(0, np.uint32), np.empty(0, np.uint32))
+
+        src = colors_to_array(cmap.keys())
+        dst = colors_to_array(cmap.values())
+
+        # Fractional source colors can never match a decoded pixel
+        exact = np.all(src == np.floor(src), axis=1)
+
+        return cls(
+            pack_rgba(src[exact].astype(np.uint8)),
+            pack_rgba(dst[exact].astype(np.uint8))
+        )
+
+    @classmethod
+    def from_nearest(cls, pa: Palette, pb: Palette):
+        """
+        Compile Lookup Table Mapping each Color of Palette A to its Nearest Color (Euclidean RGB) in Palette B
+
+        :param pa: Palette Object (Source)
+        :param pb: Palette Object (Target)
+        :return: cls
+        """
+        src = colors_to_array(pa)
+        dst = colors_to_array(pb)
+
+        if len(src) == 0 or len(dst) == 0:
+            return cls(np.empty(0, np.uint32), np.empty(0, np.uint32))
+
+        # Source rows in chunks, so the distance matrix stays within BATCH_ELEMENTS
+        index = np.empty(len(src), dtype=np.intp)
+        step = max(BATCH_ELEMENTS // len(dst), 1)
+        for start in range(0, len(src), step):
+            dist = ((src[start:start + step, None, :3] - dst[None, :, :3]) ** 2).sum(axis=-1)
+            index[start:start + step] = np.argmin(dist, axis=1)
+
+        nearest = dst[index]
+        exact = np.all(src == np.floor(src), axis=1)
+
+        return cls(
+            pack_rgba(src[exact].astype(np.uint8)),
+            pack_rgba(nearest[exact].astype(np.uint8))
+        )
+
+    def to_shared(self, name: str = None) -> SharedLookupTable:
+        """
+        Publish Table into Shared Memory for Process-Pool Workers
+
+        :param name: Shared Memory Block Name (str), None for a Random Name
+        :return: SharedLookupTable (Owner)
+        """
+        return SharedLookupTable.publish(self, name=name)
+
+    def apply(self, packed: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Remap Packed Pixels through the Table
+
+        :param packed: Array of Packed Pixels (uint32)
+        :param out: Output Array (uint32), may be the input itself
+        :return: np.ndarray(uint32)
+        """
+        if out is None:
+            out = np.empty_like(packed)
+
+        if len(self.keys) == 0:
+            np.copyto(out, packed)
+            return out
+
+        idx, hit = self.match(packed)
+        np.copyto(out, packed)
+        np.copyto(out, self.values[idx], where=hit)
+        return out
+
+    def match(self, packed: np.ndarray) -> tuple:
+        """
+        Table Index of Packed Pixels and whether the Pixel is in the Table
+
+        :param packed: Array of Packed Pixels (uint32)
+        :return: tuple(np.ndarray(intp) Index, np.ndarray(bool) Hit)
+        """
+        if len(self.keys) == 0:
+            return np.zeros(packed.shape, dtype=np.intp), np.zeros(packed.shape, dtype=bool)
+
+        idx = np.searchsorted(self.keys, packed)
+        np.minimum(idx, len(self.keys) - 1, out=idx)
+        return idx, self.keys[idx] == packed
+
+    def __len__(self):
+        return len(self.keys)
+
+
+@lru_cache(maxsize=256)
+def _nearest_table(pa: FrozenPalette, pb: FrozenPalette) -> LookupTable:
+    return LookupTable.from_nearest(pa, pb)
+
+
+def nearest_table(pa: Palette | FrozenPalette, pb: Palette | FrozenPalette) -> LookupTable:
+    """
+    Nearest-Color Lookup Table Memoized per Palette Pair (Keyed by FrozenPalette)
+
+    :param pa: Palette or FrozenPalette Object (Source)
+    :param pb: Palette or FrozenPalette Object (Target)
+    :return: LookupTable (Shared, do not Modify)
+    """
+    pa = pa if isinstance(pa, FrozenPalette) else pa.freeze()
+    pb = pb if isinstance(pb, FrozenPalette) else pb.freeze()
+    return _nearest_table(pa, pb)
+
+
+_ATTACHED = {}
+
+
+class SharedLookupTable(LookupTable):
+    """
+    Lookup Table Backed by `multiprocessing.shared_memory` (Keys and Values as one (2, N) uint32 Block)
+
+    Pickling only sends the block name and size, and workers attach to the block
+    zero-copy once per process, so tasks can carry the table for free.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, size: int, owner=False):
+        self._shm = shm
+        self._size = size
+        self.owner = owner
+
+        table = np.ndarray((2, size), dtype=np.uint32, buffer=shm.buf)
+        if not owner:
+            table.flags.writeable = False
+
+        self.keys = table[0]
+        self.values = table[1]
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @classmethod
+    def publish(cls, table: LookupTable, name: str = None):
+        """
+        Copy Lookup Table into a New Shared Memory Block
+
+        :param table: LookupTable Object
+        :param name: Shared Memory Block Name (str), None for a Random Name
+        :return: cls (Owner, Responsible for `unlink`)
+        """
+        size = len(table)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(2 * size * 4, 8))
+
+        shared = cls(shm, size, owner=True)
+        shared.keys[:] = table.keys
+        shared.values[:] = table.values
+        return shared
+
+    @classmethod
+    def attach(cls, name: str, size: int):
+        """
+        Attach to a Published Table (Cached per Process)
+
+        :param name: Shared Memory Block Name (str)
+        :param size: Number of Table Entries (int)
+        :return: cls
+        """
+        if name in _ATTACHED:
+            return _ATTACHED[name]
+
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+
+        shared = cls(shm, size)
+        _ATTACHED[name] = shared
+        return shared
+
+    def __reduce__(self):
+        return SharedLookupTable.attach, (self.name, self._size)
+
+    def close(self) -> None:
+        """
+        Release this Process' Mapping of the Block
+
+        :return:
+        """
+        _ATTACHED.pop(self.name, None)
+        self.keys = self.values = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Close and Destroy the Shared Memory Block (Called once, by the Owner)
+
+        :return:
+        """
+        self.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import pkgutil
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from paleta.array import colors_to_array
+from paleta.color import Color
+from paleta.palette import Palette
+from paleta.space import rgb_to_oklab
+
+NAME_SETS = ("css", "x11", "xkcd")
+
+_CHUNK = 4096
+
+
+@lru_cache(maxsize=None)
+def load_names(names="css") -> Dict[str, Color]:
+    """
+    Load a Bundled Named-Color Set {Name : Color}
+
+    - css  : CSS Color Module Level 4 (148 Colors)
+    - x11  : X11 rgb.txt (658 Colors)
+    - xkcd : XKCD Color Survey (949 Colors)
+
+    :param names: Name Set ("css", "x11", "xkcd")
+    :return: dict (Shared, do not Modify)
+    """
+    if names not in NAME_SETS:
+        raise ValueError(f"Unsupported name set `{names}`. Must be one of {list(NAME_SETS)}")
+
+    result = {}
+    for line in pkgutil.get_data("paleta", f"data/{names}.txt").decode("utf-8").splitlines():
+        # Entries are "#rrggbb name" and comments start with "# "
+        if line and not line.startswith("# "):
+            code, name = line.split(" ", 1)
+            result[name] = Color.from_hex(code)
+    return result
+
+
+class NameIndex:
+    """
+    Nearest Named-Color Index in OKLab
+
+    Name coordinates and their squared norms are computed once, so a lookup is one
+    matrix product and an argmin per chunk of queries (duplicates are resolved once).
+    """
+
+    def __init__(self, names: Dict[str, Color | tuple]):
+        if not names:
+            raise ValueError("Name index needs at least one named color")
+
+        self.names = list(names)
+        self.colors = [c if isinstance(c, Color) else Color(*c) for c in names.values()]
+        self.points = rgb_to_oklab(colors_to_array(self.colors)[:, :3])
+        self._norms = (self.points ** 2).sum(axis=1)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def from_set(cls, names="css") -> NameIndex:
+        """
+        Prebuilt Index of a Bundled Name Set (Cached)
+
+        :param names: Name Set ("css", "x11", "xkcd")
+        :return: NameIndex
+        """
+        return cls(load_names(names))
+
+    def query(self, rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest Name Index and OKLab Distance for RGB Values (N, 3+) in 0 - 255
+
+        :param rgb: Array of RGB/A Values
+        :return: tuple(np.ndarray(int64), np.ndarray(float64))
+        """
+        rgb = np.asarray(rgb, dtype=np.float64).reshape(-1, np.shape(rgb)[-1])[:, :3]
+        unique, inverse = np.unique(rgb, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        index = np.empty(len(unique), dtype=np.int64)
+        dist = np.empty(len(unique))
+        for start in range(0, len(unique), _CHUNK):
+            points = rgb_to_oklab(unique[start:start + _CHUNK])
+            # |p - q|^2 = |p|^2 - 2 p.q + |q|^2, the |p|^2 term does not change the argmin
+            cost = self._norms - 2 * points @ self.points.T
+            best = np.argmin(cost, axis=1)
+            index[start:start + _CHUNK] = best
+            dist[start:start + _CHUNK] = np.sqrt(np.maximum(
+                cost[np.arange(len(best)), best] + (points ** 2).sum(axis=1), 0
+            ))
+
+        return index[inverse], dist[inverse]
+
+    def nearest(self, colors: Palette | list) -> List[str]:
+        """
+        Nearest Name for each Color (in List Order)
+
+        :param colors: Palette or List of Colors
+        :return: list(str)
+        """
+        colors = colors.to_list() if isinstance(colors, Palette) else list(colors)
+        if not colors:
+            return []
+
+        index, _ = self.query(colors_to_array(colors))
+        return [self.names[i] for i in index.tolist()]
+
+    def __len__(self):
+        return len(self.names)
+
+
+def nearest_name(color: Color | tuple, names="css") -> str:
+    """
+    Nearest Name of a Color in a Bundled Name Set
+
+    :param color: Color Object or Tuple (R,G,B,*A)
+    :param names: Name Set ("css", "x11", "xkcd")
+    :return: str
+    """
+    return NameIndex.from_set(names).nearest([color])[0]
+
+
+def nearest_names(colors: Palette | list, names="css") -> List[str]:
+    """
+    Nearest Name of each Color in a Bundled Name Set (in List Order)
+
+    :param colors: Palette or List of Colors
+    :param names: Name Set ("css", "x11", "xkcd")
+    :return: list(str)
+    """
+    return NameIndex.from_set(names).nearest(colors)
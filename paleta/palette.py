@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import random
+import struct
 from typing import List, Dict
 
 from paleta.api import LospecAPI
@@ -90,6 +92,9 @@ class Palette:
         if isinstance(other, Palette):
             return self.colors == other.colors
 
+        if isinstance(other, FrozenPalette):
+            return self.color_set == other.color_set
+
         if isinstance(other, set):
             return self.colors == other
 
@@ -186,6 +191,202 @@ class Palette:
         """
         return {x.hex: x.rgba for x in self.colors}
 
+    def to_names(self, names="css") -> Dict[str, str]:
+        """
+        Returns a Dict Object of Set {Hex : Nearest Color Name} from a Bundled Name Set
+
+        :param names: Name Set ("css", "x11", "xkcd")
+        :return: dict
+        """
+        from paleta.names import nearest_names
+
+        colors = self.to_list()
+        return {x.hex: name for x, name in zip(colors, nearest_names(colors, names=names))}
+
+    def freeze(self) -> FrozenPalette:
+        """
+        Returns an Immutable, Hashable Copy of the Palette
+
+        :return: FrozenPalette
+        """
+        return FrozenPalette(*self.colors)
+
+
+class FrozenPalette:
+    """
+    Immutable Palette (Frozen Set of RGBA Tuples) with a Content Fingerprint
+
+    Hashable, so it can be used as a dict key to cache mappings per palette pair.
+    """
+
+    __slots__ = ("_rgba", "_hash", "_fingerprint")
+
+    def __init__(self, *colors: Color | tuple):
+        rgba = set()
+        for color in colors:
+            if isinstance(color, Color):
+                rgba.add(color.rgba)
+            elif isinstance(color, tuple):
+                rgba.add(Color(*color).rgba)
+            else:
+                raise ValueError(f"Unable to add color to FrozenPalette of type `{type(color)}`")
+
+        self._rgba = frozenset(rgba)
+        self._hash = hash(self._rgba)
+        self._fingerprint = None
+
+    @classmethod
+    def _from_rgba(cls, rgba: frozenset) -> FrozenPalette:
+        palette = cls.__new__(cls)
+        palette._rgba = rgba
+        palette._hash = hash(rgba)
+        palette._fingerprint = None
+        return palette
+
+    @property
+    def color_set(self) -> frozenset:
+        """
+        Colors as Frozen Set of RGBA Tuple
+
+        :return: frozenset
+        """
+        return self._rgba
+
+    @property
+    def colors(self) -> frozenset:
+        """
+        Colors as Frozen Set of Color Object (New Objects on every Access, Changing them does not Change the Palette)
+
+        :return: frozenset
+        """
+        return frozenset(Color(*x) for x in self._rgba)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Stable Content Fingerprint (BLAKE2b of the Sorted, Packed RGBA Values), Computed Once
+
+        :return: str
+        """
+        if self._fingerprint is None:
+            packed = b"".join(struct.pack("<4d", *x) for x in sorted(self._rgba))
+            self._fingerprint = hashlib.blake2b(packed, digest_size=16).hexdigest()
+        return self._fingerprint
+
+    def thaw(self) -> Palette:
+        """
+        Returns a Mutable Palette Copy
+
+        :return: Palette
+        """
+        return Palette(*(Color(*x) for x in self._rgba))
+
+    @staticmethod
+    def _other_rgba(other) -> frozenset:
+        if isinstance(other, FrozenPalette):
+            return other._rgba
+        if isinstance(other, Palette):
+            return frozenset(other.color_set)
+
+        raise TypeError(f'Unsupported operation with class "{type(other)}". Must be instance of {FrozenPalette}')
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenPalette):
+            return self._hash == other._hash and self._rgba == other._rgba
+
+        if isinstance(other, Palette):
+            return self._rgba == other.color_set
+
+        if isinstance(other, (set, frozenset)):
+            return self.colors == other
+
+        return False
+
+    def __iter__(self):
+        return iter(self.colors)
+
+    def __len__(self):
+        return len(self._rgba)
+
+    def __contains__(self, item):
+        if isinstance(item, Color):
+            return item.rgba in self._rgba
+
+        if isinstance(item, tuple) or isinstance(item, list):
+            return tuple(item) in self._rgba
+
+        return False
+
+    def __or__(self, other):
+        return FrozenPalette._from_rgba(self._rgba | self._other_rgba(other))
+
+    def __add__(self, other):
+        return self.__or__(other)
+
+    def __and__(self, other):
+        return FrozenPalette._from_rgba(self._rgba & self._other_rgba(other))
+
+    def __sub__(self, other):
+        return FrozenPalette._from_rgba(self._rgba - self._other_rgba(other))
+
+    def __xor__(self, other):
+        return FrozenPalette._from_rgba(self._rgba ^ self._other_rgba(other))
+
+    def __le__(self, other):
+        return self._rgba <= self._other_rgba(other)
+
+    def __ge__(self, other):
+        return self._rgba >= self._other_rgba(other)
+
+    def __repr__(self):
+        return f"FrozenPalette({len(self)} colors, {self.fingerprint})"
+
+    def union(self, other: FrozenPalette | Palette):
+        """
+        Union with Other Palette Set
+
+        :param other: FrozenPalette or Palette Object
+        :return: FrozenPalette Object
+        """
+        return self.__or__(other)
+
+    def difference(self, other: FrozenPalette | Palette):
+        """
+        Difference between Other Palette Set
+
+        :param other: FrozenPalette or Palette Object
+        :return: FrozenPalette Object
+        """
+        return self.__sub__(other)
+
+    def intersection(self, other: FrozenPalette | Palette):
+        """
+        Intersection between Other Palette Set
+
+        :param other: FrozenPalette or Palette Object
+        :return: FrozenPalette Object
+        """
+        return self.__and__(other)
+
+    def to_list(self) -> List[Color]:
+        """
+        Returns a List Object of Set
+
+        :return: list
+        """
+        return list(self.colors)
+
+    def to_dict(self) -> Dict[str, tuple]:
+        """
+        Returns a Dict Object of Set {Hex : (R, G, B, A)}
+
+        :return: dict
+        """
+        return {x.hex: x.rgba for x in self.colors}
+
 
 class ConversionPalette:
 
@@ -222,15 +423,46 @@ class ConversionPalette:
 
         return cls(cmap=cmap)
 
+    def compose(self, *others: ConversionPalette | dict) -> ConversionPalette:
+        """
+        Compose with Conversion Palettes Applied Afterwards (A -> B then B -> C gives A -> C)
+
+        Colors a step does not map pass through it unchanged, so the result is
+        equivalent to applying every step in order.
+
+        :param others: ConversionPalette Objects or Dicts {(R, G, B, A): (R, G, B, A)}
+        :return: ConversionPalette
+        """
+        cmap = self.to_dict()
+
+        for other in others:
+            step = other.to_dict() if isinstance(other, ConversionPalette) else ConversionPalette(other).to_dict()
+            cmap = {k: step.get(v, v) for k, v in cmap.items()}
+
+            for k, v in step.items():
+                cmap.setdefault(k, v)
+
+        return ConversionPalette({Color(*k): Color(*v) for k, v in cmap.items()})
+
+    def __rshift__(self, other):
+        if isinstance(other, (ConversionPalette, dict)):
+            return self.compose(other)
+
+        raise TypeError(f'Unsupported operation with class "{type(other)}". Must be instance of {self.__class__}')
+
     def __getitem__(self, item):
         return self.cmap[item]
 
     def __contains__(self, item):
         return item in self.cmap.keys()
 
+    def __len__(self):
+        return len(self.cmap or {})
+
     def to_dict(self):
         return {
-            k.rgba: v.rgba for k, v in self.cmap.items()
+            (k if isinstance(k, Color) else Color(*k)).rgba: (v if isinstance(v, Color) else Color(*v)).rgba
+            for k, v in (self.cmap or {}).items()
         }
 
 
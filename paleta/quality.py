@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+from paleta.array import TILE_ROWS, array_to_colors, map_tiles, pack_rgba, unpack_rgba
+from paleta.color import Color
+from paleta.image import load_pixels
+from paleta.lut import LookupTable
+from paleta.palette import ConversionPalette
+from paleta.space import rgb_to_lab
+
+
+def delta_e(rgb_a: np.ndarray, rgb_b: np.ndarray) -> np.ndarray:
+    """
+    CIE76 Color Difference (Euclidean Distance in L*a*b*) between RGB Values (..., 3) in 0 - 255
+
+    :param rgb_a: Array of RGB Values
+    :param rgb_b: Array of RGB Values
+    :return: np.ndarray(float64)
+    """
+    return np.linalg.norm(rgb_to_lab(np.asarray(rgb_a)[..., :3]) - rgb_to_lab(np.asarray(rgb_b)[..., :3]), axis=-1)
+
+
+class ConversionQuality:
+    """
+    Color Error of a Conversion over the Unique (Source, Converted) Color Pairs Weighted by Pixel Count
+
+    Errors are CIE76 ΔE (about 2.3 is a just noticeable difference) and PSNR is over
+    the RGB channels. Pixels at or below the alpha threshold of the source are ignored.
+    """
+
+    def __init__(self, source: np.ndarray, converted: np.ndarray, counts: np.ndarray):
+        self.source = source
+        self.converted = converted
+        self.counts = counts
+        self.errors = delta_e(unpack_rgba(source), unpack_rgba(converted))
+
+    @property
+    def pixels(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def mean_error(self) -> float:
+        """
+        Mean ΔE per Pixel
+
+        :return: float
+        """
+        if self.pixels == 0:
+            return 0.0
+        return float(self.errors @ self.counts / self.pixels)
+
+    @property
+    def max_error(self) -> float:
+        """
+        Largest ΔE of any Pixel
+
+        :return: float
+        """
+        return float(self.errors.max()) if len(self.errors) else 0.0
+
+    @property
+    def mse(self) -> float:
+        """
+        Mean Squared Error of the RGB Channels
+
+        :return: float
+        """
+        if self.pixels == 0:
+            return 0.0
+        diff = unpack_rgba(self.source)[:, :3].astype(np.float64) - unpack_rgba(self.converted)[:, :3]
+        return float((diff ** 2).sum(axis=1) @ self.counts / (3 * self.pixels))
+
+    @property
+    def psnr(self) -> float:
+        """
+        Peak Signal-to-Noise Ratio in dB (Infinite for Identical Colors)
+
+        :return: float
+        """
+        mse = self.mse
+        return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+    def per_entry(self) -> List[Tuple[Color, int, float, float]]:
+        """
+        Error per Converted Palette Entry as (Color, Pixels, Mean ΔE, Max ΔE), Worst Mean First
+
+        :return: list(tuple(Color, int, float, float))
+        """
+        entries, index = np.unique(self.converted, return_inverse=True)
+        pixels = np.bincount(index, weights=self.counts, minlength=len(entries))
+        total = np.bincount(index, weights=self.errors * self.counts, minlength=len(entries))
+        worst = np.zeros(len(entries))
+        np.maximum.at(worst, index, self.errors)
+
+        mean = total / np.maximum(pixels, 1)
+        order = np.argsort(-mean, kind="stable")
+        colors = array_to_colors(unpack_rgba(entries[order]))
+
+        return list(zip(colors, pixels[order].astype(int).tolist(), mean[order].tolist(), worst[order].tolist()))
+
+    def passes(self, max_mean=2.3, max_error=None) -> bool:
+        """
+        Check Conversion against Error Thresholds (for CI Gates)
+
+        :param max_mean: Highest Accepted Mean ΔE (float)
+        :param max_error: Highest Accepted ΔE of any Pixel (float), None to Skip
+        :return: bool
+        """
+        return self.mean_error <= max_mean and (max_error is None or self.max_error <= max_error)
+
+    def to_dict(self) -> dict:
+        return {
+            "pixels": self.pixels,
+            "mean_error": self.mean_error,
+            "max_error": self.max_error,
+            "psnr": self.psnr,
+        }
+
+
+def _pair_counts(pixels: np.ndarray, converted: np.ndarray, alpha_threshold=0, workers=1, tile_rows=TILE_ROWS):
+    src, dst = pack_rgba(pixels), pack_rgba(converted)
+
+    def _pairs(rows):
+        visible = pixels[rows, :, 3] > alpha_threshold
+        pairs = (src[rows][visible].astype(np.uint64) << np.uint64(32)) | dst[rows][visible]
+        return np.unique(pairs, return_counts=True)
+
+    tiles = map_tiles(_pairs, src.shape[0], workers=workers, tile_rows=tile_rows)
+    if not tiles:
+        return np.empty(0, np.uint64), np.empty(0, np.int64)
+
+    pairs, index = np.unique(np.concatenate([p for p, _ in tiles]), return_inverse=True)
+    counts = np.bincount(index, weights=np.concatenate([c for _, c in tiles]), minlength=len(pairs))
+    return pairs, counts
+
+
+def conversion_quality(f_in, f_out=None, cmap: ConversionPalette | dict = None, alpha_threshold=0, workers=1,
+                       tile_rows=TILE_ROWS) -> ConversionQuality:
+    """
+    Measure Color Error between a Source and its Converted Image, or the Source Converted by `cmap`
+
+    :param f_in: Source Image
+    :param f_out: Converted Image
+    :param cmap: ConversionPalette, Dict or LookupTable (Used when `f_out` is not Given)
+    :param alpha_threshold: Ignore Source Pixels with Alpha at or below (int)
+    :param workers: Number of Threads (int)
+    :param tile_rows: Rows per Tile (int)
+    :return: ConversionQuality
+    """
+    pixels = load_pixels(f_in)
+
+    if f_out is not None:
+        converted = load_pixels(f_out)
+        if converted.shape != pixels.shape:
+            raise ValueError(f"Converted image of shape {converted.shape} does not match source {pixels.shape}")
+        pairs, counts = _pair_counts(pixels, converted, alpha_threshold, workers=workers, tile_rows=tile_rows)
+        source = (pairs >> np.uint64(32)).astype(np.uint32)
+        target = (pairs & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        return ConversionQuality(source, target, counts.astype(np.int64))
+
+    if cmap is None:
+        raise ValueError("Either a converted image `f_out` or a `cmap` is required")
+
+    # Every pixel of a source color converts alike, so the unique colors are enough
+    pairs, counts = _pair_counts(pixels, pixels, alpha_threshold, workers=workers, tile_rows=tile_rows)
+    source = (pairs >> np.uint64(32)).astype(np.uint32)
+    return ConversionQuality(source, LookupTable.from_cmap(cmap).apply(source), counts.astype(np.int64))
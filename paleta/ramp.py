@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Callable, List
+
+import numpy as np
+
+from paleta.array import array_to_colors, colors_to_array
+from paleta.color import Color
+from paleta.palette import Palette, FrozenPalette
+from paleta.sort import sort_order
+from paleta.space import from_space, to_space
+
+EASINGS = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: t * (2 - t),
+    "ease_in_out": lambda t: t * t * (3 - 2 * t),
+}
+
+
+def _easing(easing: str | Callable) -> Callable:
+    if callable(easing):
+        return easing
+
+    if easing not in EASINGS:
+        raise ValueError(f"Unsupported easing `{easing}`. Must be one of {list(EASINGS)} or a callable")
+    return EASINGS[easing]
+
+
+def _stops(colors: Palette | list) -> np.ndarray:
+    if not isinstance(colors, (Palette, FrozenPalette)):
+        return colors_to_array(colors)
+
+    # Palettes are unordered sets, so stops go darkest first (ties by RGBA) to be the same on every run
+    rgba = colors_to_array(sorted(colors.to_list(), key=lambda c: c.rgba))
+    return rgba[sort_order(rgba, by="lightness")] if len(rgba) else rgba
+
+
+def ramp_array(stops: np.ndarray, steps: int, space="rgb", easing: str | Callable = "linear") -> np.ndarray:
+    """
+    Interpolate Batches of Ordered Color Stops in One Vectorized Call
+
+    Every segment between two neighboring stops yields `steps` colors (starting with
+    its first stop), and the last stop closes the ramp, so a ramp of K stops has
+    (K - 1) * steps + 1 colors. Alpha is interpolated linearly, without the easing.
+
+    :param stops: Array of RGBA Stops (K, 4) or Batch of Ramps (R, K, 4)
+    :param steps: Colors per Segment (int)
+    :param space: Interpolation Space ("rgb", "hsl", "hsv", "oklab", "lab")
+    :param easing: Easing Name or Callable on Array of t in [0, 1)
+    :return: np.ndarray(float64) of (..., (K - 1) * steps + 1, 4)
+    """
+    stops = np.asarray(stops, dtype=np.float64)
+    if stops.ndim < 2 or stops.shape[-1] != 4:
+        raise ValueError(f"Stops must be of shape (K, 4) or (R, K, 4), got {stops.shape}")
+    if steps < 1:
+        raise ValueError(f"Steps must be a positive integer, got {steps}")
+    if stops.shape[-2] < 2:
+        return stops.copy()
+
+    values = to_space(stops[..., :3], space)
+    start, end = values[..., :-1, :], values[..., 1:, :]
+    delta = end - start
+
+    if space in ("hsl", "hsv"):
+        # Interpolate hue along the shorter arc
+        delta[..., 0] = (delta[..., 0] + 180) % 360 - 180
+
+    linear = np.arange(steps) / steps
+    t = np.asarray(_easing(easing)(linear), dtype=np.float64)[:, None]
+    inner = start[..., None, :] + delta[..., None, :] * t
+    # Alpha ignores the easing
+    alpha = stops[..., :-1, None, 3] + (stops[..., 1:, None, 3] - stops[..., :-1, None, 3]) * linear
+
+    rgb = np.clip(np.rint(from_space(inner, space)), 0, 255)
+    colors = np.concatenate([rgb, np.clip(alpha, 0, 255)[..., None]], axis=-1)
+    colors = colors.reshape(stops.shape[:-2] + (-1, 4))
+
+    return np.concatenate([colors, stops[..., -1:, :]], axis=-2)
+
+
+def ramp(colors: Palette | list, steps: int, space="rgb", easing: str | Callable = "linear") -> List[Color]:
+    """
+    Generate an Ordered Ramp between Colors (in List Order, Palettes Darkest First)
+
+    :param colors: Palette, FrozenPalette or Ordered List of Colors
+    :param steps: Colors per Segment (int)
+    :param space: Interpolation Space ("rgb", "hsl", "hsv", "oklab", "lab")
+    :param easing: Easing Name or Callable
+    :return: list(Color)
+    """
+    return array_to_colors(ramp_array(_stops(colors), steps, space=space, easing=easing))
+
+
+def ramps(ramp_list: list, steps: int, space="rgb", easing: str | Callable = "linear") -> List[List[Color]]:
+    """
+    Generate Many Ordered Ramps with the Same Number of Stops in One Call
+
+    :param ramp_list: List of Ordered Lists of Colors (Palettes Darkest First)
+    :param steps: Colors per Segment (int)
+    :param space: Interpolation Space ("rgb", "hsl", "hsv", "oklab", "lab")
+    :param easing: Easing Name or Callable
+    :return: list(list(Color))
+    """
+    if not ramp_list:
+        return []
+
+    stops = np.stack([_stops(colors) for colors in ramp_list])
+    return [array_to_colors(r) for r in ramp_array(stops, steps, space=space, easing=easing)]
+
+
+def gradient_table(colors: Palette | list, size=256, space="rgb", smooth=True) -> np.ndarray:
+    """
+    Gradient Map Table Spreading Ordered Colors (Darkest First) over `size` Lightness Levels
+
+    :param colors: Palette, FrozenPalette (Sorted Darkest First) or Ordered List of Colors
+    :param size: Number of Table Entries (int)
+    :param space: Interpolation Space ("rgb", "hsl", "hsv", "oklab", "lab")
+    :param smooth: Interpolate between Colors, otherwise Split the Levels into even Bands (bool)
+    :return: np.ndarray(uint8) of (size, 4)
+    """
+    stops = _stops(colors)
+    if len(stops) == 0:
+        raise ValueError("Gradient map needs at least one color")
+
+    if smooth and len(stops) > 1:
+        # Sample the finest ramp that still puts every stop on an exact level
+        segments = len(stops) - 1
+        table = ramp_array(stops, size - 1, space=space)
+        index = np.rint(np.linspace(0, segments * (size - 1), size)).astype(np.intp)
+        table = table[index]
+    else:
+        table = stops[np.arange(size) * len(stops) // size]
+
+    return np.clip(np.rint(table), 0, 255).astype(np.uint8)
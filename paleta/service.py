@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from paleta.array import unpack_rgba
+from paleta.color import Color
+from paleta.image import convert_palette, export_palette, extract_palette_ext
+from paleta.lut import LookupTable
+from paleta.palette import Palette
+
+
+class PaletteService:
+    """
+    Palette Service State (Warm Palettes, Lookup Tables and Request Metrics)
+
+    Requests and responses are JSON dicts. Colors are given as hexadecimal codes
+    or lists of (R, G, B, *A), and palettes as {"colors": [...]}, {"image": path}
+    or {"lospec": name}.
+
+    Warm palettes and tables are kept in least recently used order and evicted beyond
+    `max_palettes` / `max_tables` (image keys include the file mtime, so edits go stale).
+    """
+
+    def __init__(self, max_palettes: int = 256, max_tables: int = 256):
+        self._lock = threading.Lock()
+        self._palettes = OrderedDict()
+        self._tables = OrderedDict()
+        self._limits = {"palettes": max_palettes, "tables": max_tables}
+        self._evictions = {"palettes": 0, "tables": 0}
+        self._metrics = {}
+        self._started = time.time()
+
+        self.endpoints = {
+            "extract": self.extract,
+            "map": self.map,
+            "convert": self.convert,
+            "export": self.export,
+        }
+
+    def _cached(self, cache: OrderedDict, key):
+        # Called with the lock held
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        return None
+
+    def _store(self, name: str, cache: OrderedDict, key, value) -> None:
+        # Called with the lock held
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self._limits[name]:
+            cache.popitem(last=False)
+            self._evictions[name] += 1
+
+    @staticmethod
+    def _color(value) -> Color:
+        if isinstance(value, str):
+            return Color.from_hex(value)
+        if isinstance(value, (list, tuple)):
+            return Color(*value)
+        raise ValueError(f"Unable to read color of type `{type(value)}`")
+
+    @staticmethod
+    def _palette_key(spec: dict) -> tuple:
+        if "colors" in spec:
+            return "colors", tuple(tuple(c) if isinstance(c, list) else c for c in spec["colors"])
+        if "image" in spec:
+            path = os.path.abspath(spec["image"])
+            return "image", path, os.stat(path).st_mtime_ns, spec.get("alpha_threshold", 0)
+        if "lospec" in spec:
+            return "lospec", spec["lospec"]
+        raise ValueError('Palette must be given by "colors", "image" or "lospec"')
+
+    def palette(self, spec: dict) -> tuple:
+        """
+        Resolve Palette Spec through the Warm Palette Cache
+
+        :param spec: Palette Spec (dict)
+        :return: tuple(Key, Palette)
+        """
+        key = self._palette_key(spec)
+        with self._lock:
+            palette = self._cached(self._palettes, key)
+        if palette is not None:
+            return key, palette
+
+        if key[0] == "colors":
+            palette = Palette(*(self._color(c) for c in spec["colors"]))
+        elif key[0] == "image":
+            palette = extract_palette_ext(spec["image"], alpha_threshold=key[-1])
+        else:
+            palette = Palette.from_lospec(spec["lospec"])
+
+        with self._lock:
+            self._store("palettes", self._palettes, key, palette)
+        return key, palette
+
+    def table(self, source: dict, target: dict) -> LookupTable:
+        """
+        Resolve Nearest-Color Lookup Table between Palette Specs through the Warm Table Cache
+
+        :param source: Palette Spec (dict)
+        :param target: Palette Spec (dict)
+        :return: LookupTable
+        """
+        (ka, pa), (kb, pb) = self.palette(source), self.palette(target)
+        with self._lock:
+            table = self._cached(self._tables, (ka, kb))
+        if table is not None:
+            return table
+
+        table = LookupTable.from_nearest(pa, pb)
+        with self._lock:
+            self._store("tables", self._tables, (ka, kb), table)
+        return table
+
+    def extract(self, payload: dict) -> dict:
+        _, palette = self.palette(payload)
+        return {"colors": sorted(c.irgba for c in palette)}
+
+    def map(self, payload: dict) -> dict:
+        table = self.table(payload["source"], payload["target"])
+        return {"cmap": list(zip(unpack_rgba(table.keys).tolist(), unpack_rgba(table.values).tolist()))}
+
+    def convert(self, payload: dict) -> dict:
+        image = payload["image"]
+        output = payload.get("output", image)
+
+        if "cmap" in payload:
+            cmap = {tuple(self._color(a).irgba): tuple(self._color(b).irgba) for a, b in payload["cmap"]}
+        else:
+            cmap = self.table(payload.get("source", {"image": image}), payload["target"])
+
+        convert_palette(image, cmap, f_out=output, workers=payload.get("workers", 1))
+        return {"output": output}
+
+    def export(self, payload: dict) -> dict:
+        if "colors" in payload:
+            colors = [self._color(c) for c in payload["colors"]]
+        else:
+            colors = self.palette(payload)[1].to_list()
+
+        export_palette(colors, payload["output"], size=tuple(payload.get("size", (8, 8))))
+        return {"output": payload["output"]}
+
+    def handle(self, endpoint: str, payload: dict) -> tuple:
+        """
+        Run Endpoint and Record its Latency
+
+        :param endpoint: Endpoint Name (str)
+        :param payload: Request (dict)
+        :return: tuple(Status Code, Response)
+        """
+        if endpoint not in self.endpoints:
+            return 404, {"error": f"Unknown endpoint `{endpoint}`"}
+
+        start = time.perf_counter()
+        try:
+            status, response = 200, self.endpoints[endpoint](payload)
+        except (KeyError, ValueError, TypeError, OSError) as e:
+            status, response = 400, {"error": f"{type(e).__name__}: {e}"}
+        except Exception as e:
+            status, response = 500, {"error": f"{type(e).__name__}: {e}"}
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            stats = self._metrics.setdefault(endpoint, {"requests": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0})
+            stats["requests"] += 1
+            stats["errors"] += status != 200
+            stats["total_s"] += elapsed
+            stats["max_s"] = max(stats["max_s"], elapsed)
+
+        return status, response
+
+    def metrics(self) -> dict:
+        """
+        Request Throughput, Latency and Cache Metrics
+
+        :return: dict
+        """
+        with self._lock:
+            uptime = time.time() - self._started
+            endpoints = {
+                name: {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    "mean_ms": 1000 * stats["total_s"] / stats["requests"],
+                    "max_ms": 1000 * stats["max_s"],
+                }
+                for name, stats in self._metrics.items()
+            }
+            total = sum(stats["requests"] for stats in self._metrics.values())
+
+            return {
+                "uptime_s": uptime,
+                "requests": total,
+                "throughput_rps": total / uptime if uptime > 0 else 0.0,
+                "endpoints": endpoints,
+                "cache": {
+                    "palettes": len(self._palettes),
+                    "tables": len(self._tables),
+                    "evictions": dict(self._evictions),
+                },
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, status: int, response: dict):
+        body = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _forbidden(self, post: bool) -> str:
+        # Browsers send simple cross-origin POSTs (text/plain, no preflight) to local ports,
+        # and DNS rebinding reaches them under a foreign Host, so both are refused
+        if self.headers.get("Host", "") not in self.server.hosts:
+            return f"Host `{self.headers.get('Host')}` does not match the server address"
+        if post and "Origin" in self.headers:
+            return "Cross-origin requests are not accepted"
+        if post and self.headers.get("Content-Type", "").split(";")[0].strip().lower() != "application/json":
+            return "Content-Type must be application/json"
+        return ""
+
+    def do_GET(self):
+        error = self._forbidden(post=False)
+        if error:
+            self._reply(403, {"error": error})
+        elif self.path == "/metrics":
+            self._reply(200, self.server.service.metrics())
+        elif self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        else:
+            self._reply(404, {"error": f"Unknown path `{self.path}`"})
+
+    def do_POST(self):
+        error = self._forbidden(post=True)
+        if error:
+            self._reply(403, {"error": error})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._reply(400, {"error": f"Invalid JSON: {e}"})
+            return
+
+        self._reply(*self.server.service.handle(self.path.strip("/"), payload))
+
+    def log_message(self, format, *args):
+        return
+
+
+class PaletteServer(HTTPServer):
+    """
+    Local HTTP Server Handling Requests on a Worker Pool
+
+    Only requests whose Host is the bound address (or localhost on a loopback address) are
+    served, and POST requests must be application/json without an Origin header.
+    """
+
+    def __init__(self, address=("127.0.0.1", 0), service: PaletteService = None, workers=4):
+        super().__init__(address, _Handler)
+        self.service = service or PaletteService()
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+        host, port = self.server_address[:2]
+        self.hosts = {f"[{host}]:{port}" if ":" in host else f"{host}:{port}"}
+        if host in ("127.0.0.1", "::1"):
+            self.hosts.add(f"localhost:{port}")
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def start(self) -> threading.Thread:
+        """
+        Serve in a Background Thread
+
+        :return: threading.Thread
+        """
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local palette service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-palettes", type=int, default=256)
+    parser.add_argument("--max-tables", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    service = PaletteService(max_palettes=args.max_palettes, max_tables=args.max_tables)
+    server = PaletteServer((args.host, args.port), service=service, workers=args.workers)
+    print(f"Serving palette service on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from paleta.array import colors_to_array
+from paleta.color import Color
+from paleta.palette import Palette
+from paleta.space import rgb_to_hsv
+
+LIGHTNESS_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+
+def lightness_key(rgba: np.ndarray) -> np.ndarray:
+    """
+    Lightness Sort Key (Same as `Color.to_lightness`)
+
+    :param rgba: Array of RGB/A Values (N, 3+)
+    :return: np.ndarray(float64)
+    """
+    return np.asarray(rgba, dtype=np.float64)[:, :3] @ LIGHTNESS_WEIGHTS
+
+
+def hue_key(rgba: np.ndarray, repetitions=8) -> np.ndarray:
+    """
+    Stepped Hue Sort Key (Hue Bands, Alternating Lightness and Value within a Band)
+
+    :param rgba: Array of RGB/A Values (N, 3+)
+    :param repetitions: Number of Hue Bands (int)
+    :return: np.ndarray(int64) of Ranks
+    """
+    rgba = np.asarray(rgba, dtype=np.float64)
+    hsv = rgb_to_hsv(rgba[:, :3])
+
+    band = np.floor(hsv[:, 0] / 360 * repetitions).astype(np.int64)
+    lum = np.floor(np.sqrt(lightness_key(rgba) / 255) * repetitions).astype(np.int64)
+    val = np.floor(hsv[:, 2] * repetitions).astype(np.int64)
+
+    # Reverse every other band so that neighbouring bands meet smoothly
+    odd = band % 2 == 1
+    lum = np.where(odd, repetitions - lum, lum)
+    val = np.where(odd, repetitions - val, val)
+
+    order = np.lexsort((val, lum, band))
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return rank
+
+
+def hilbert_key(rgba: np.ndarray, bits=8) -> np.ndarray:
+    """
+    Hilbert Curve Index through RGB Space (Skilling's Transpose Algorithm)
+
+    :param rgba: Array of RGB/A Values (N, 3+) in 0 - 255
+    :param bits: Bits per Channel used for the Curve (int)
+    :return: np.ndarray(uint64)
+    """
+    x = (np.asarray(rgba)[:, :3].astype(np.uint64) >> np.uint64(8 - bits)).T.copy()
+    n = x.shape[0]
+    m = 1 << (bits - 1)
+
+    # Inverse undo
+    q = m
+    while q > 1:
+        p = np.uint64(q - 1)
+        for i in range(n):
+            high = (x[i] & np.uint64(q)) != 0
+            t = np.where(high, np.uint64(0), (x[0] ^ x[i]) & p)
+            x[0] = np.where(high, x[0] ^ p, x[0] ^ t)
+            if i:
+                x[i] ^= t
+        q >>= 1
+
+    # Gray encode
+    for i in range(1, n):
+        x[i] ^= x[i - 1]
+
+    t = np.zeros(x.shape[1], dtype=np.uint64)
+    q = m
+    while q > 1:
+        t = np.where((x[n - 1] & np.uint64(q)) != 0, t ^ np.uint64(q - 1), t)
+        q >>= 1
+    x ^= t
+
+    index = np.zeros(x.shape[1], dtype=np.uint64)
+    for b in range(bits - 1, -1, -1):
+        for i in range(n):
+            index = (index << np.uint64(1)) | ((x[i] >> np.uint64(b)) & np.uint64(1))
+    return index
+
+
+SORT_KEYS = {
+    "lightness": lightness_key,
+    "hue": hue_key,
+    "hilbert": hilbert_key,
+}
+
+
+def sort_order(rgba: np.ndarray, by="lightness", reverse=False) -> np.ndarray:
+    """
+    Get Sorting Order of Color Array by Precomputed Key
+
+    :param rgba: Array of RGB/A Values (N, 3+)
+    :param by: Sort Key ("lightness", "hue", "hilbert")
+    :param reverse: Descending Order (bool)
+    :return: np.ndarray(int64) of Indices
+    """
+    if by not in SORT_KEYS:
+        raise ValueError(f"Unsupported sort key `{by}`. Must be one of {list(SORT_KEYS)}")
+
+    order = np.argsort(SORT_KEYS[by](rgba), kind="stable")
+    return order[::-1] if reverse else order
+
+
+def sort_palette(palette: Palette | list, by="lightness", reverse=False) -> List[Color]:
+    """
+    Sort Palette into an Ordered List of Colors
+
+    :param palette: Palette or List of Colors
+    :param by: Sort Key ("lightness", "hue", "hilbert")
+    :param reverse: Descending Order (bool)
+    :return: list(Color)
+    """
+    p_list = palette
+    if isinstance(palette, Palette):
+        p_list = palette.to_list()
+
+    if not p_list:
+        return []
+
+    order = sort_order(colors_to_array(p_list), by=by, reverse=reverse)
+    return [p_list[i] for i in order.tolist()]
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def rgb_to_hsl(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert RGB (..., 3) in 0 - 255 to HSL (..., 3) as (0 - 360, 0 - 1, 0 - 1)
+
+    :param rgb: Array of RGB Values
+    :return: np.ndarray(float64)
+    """
+    rgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+
+    max_val = rgb.max(axis=-1)
+    min_val = rgb.min(axis=-1)
+    delta = max_val - min_val
+    l = (max_val + min_val) / 2.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(delta == 0, 0.0, delta / (1 - np.abs(2 * l - 1)))
+        h = np.select(
+            [delta == 0, max_val == r, max_val == g],
+            [0.0, ((g - b) / delta) % 6, (b - r) / delta + 2],
+            (r - g) / delta + 4
+        )
+
+    return np.stack([h * 60, np.nan_to_num(s), l], axis=-1)
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """
+    Convert HSL (..., 3) as (0 - 360, 0 - 1, 0 - 1) to RGB (..., 3) in 0 - 255
+
+    :param hsl: Array of HSL Values
+    :return: np.ndarray(float64)
+    """
+    hsl = np.asarray(hsl, dtype=np.float64)
+    h, s, l = hsl[..., 0:1] % 360, hsl[..., 1:2], hsl[..., 2:3]
+
+    k = (np.array([0, 8, 4]) + h / 30) % 12
+    a = s * np.minimum(l, 1 - l)
+    rgb = l - a * np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+
+    return rgb * 255.0
+
+
+def rgb_to_hsv(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert RGB (..., 3) in 0 - 255 to HSV (..., 3) as (0 - 360, 0 - 1, 0 - 1)
+
+    :param rgb: Array of RGB Values
+    :return: np.ndarray(float64)
+    """
+    rgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    max_val = rgb.max(axis=-1)
+    delta = max_val - rgb.min(axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(max_val == 0, 0.0, delta / max_val)
+
+    return np.stack([rgb_to_hsl(rgb * 255.0)[..., 0], np.nan_to_num(s), max_val], axis=-1)
+
+
+def hsv_to_rgb(hsv: np.ndarray) -> np.ndarray:
+    """
+    Convert HSV (..., 3) as (0 - 360, 0 - 1, 0 - 1) to RGB (..., 3) in 0 - 255
+
+    :param hsv: Array of HSV Values
+    :return: np.ndarray(float64)
+    """
+    hsv = np.asarray(hsv, dtype=np.float64)
+    h, s, v = hsv[..., 0:1] % 360, hsv[..., 1:2], hsv[..., 2:3]
+
+    k = (np.array([5, 3, 1]) + h / 60) % 6
+    rgb = v - v * s * np.clip(np.minimum(k, 4 - k), 0, 1)
+
+    return rgb * 255.0
+
+
+def _srgb_to_linear(c):
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(c):
+    c = np.clip(c, 0, 1)
+    return np.where(c <= 0.0031308, c * 12.92, 1.055 * c ** (1 / 2.4) - 0.055)
+
+
+_LMS_FROM_RGB = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+
+_LAB_FROM_LMS = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+
+_RGB_FROM_LMS = np.linalg.inv(_LMS_FROM_RGB)
+_LMS_FROM_LAB = np.linalg.inv(_LAB_FROM_LMS)
+
+
+def rgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert sRGB (..., 3) in 0 - 255 to Linear RGB (..., 3) in 0 - 1
+
+    :param rgb: Array of RGB Values
+    :return: np.ndarray(float64)
+    """
+    return _srgb_to_linear(np.asarray(rgb, dtype=np.float64) / 255.0)
+
+
+def linear_to_rgb(linear: np.ndarray) -> np.ndarray:
+    """
+    Convert Linear RGB (..., 3) in 0 - 1 to sRGB (..., 3) in 0 - 255
+
+    :param linear: Array of Linear RGB Values
+    :return: np.ndarray(float64)
+    """
+    return _linear_to_srgb(np.asarray(linear, dtype=np.float64)) * 255.0
+
+
+def rgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert RGB (..., 3) in 0 - 255 to OKLab (..., 3) as (L, a, b)
+
+    :param rgb: Array of RGB Values
+    :return: np.ndarray(float64)
+    """
+    lms = rgb_to_linear(rgb) @ _LMS_FROM_RGB.T
+    return np.cbrt(lms) @ _LAB_FROM_LMS.T
+
+
+def oklab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    """
+    Convert OKLab (..., 3) as (L, a, b) to RGB (..., 3) in 0 - 255
+
+    :param lab: Array of OKLab Values
+    :return: np.ndarray(float64)
+    """
+    lms = (np.asarray(lab, dtype=np.float64) @ _LMS_FROM_LAB.T) ** 3
+    return linear_to_rgb(lms @ _RGB_FROM_LMS.T)
+
+
+_XYZ_FROM_RGB = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+
+_RGB_FROM_XYZ = np.linalg.inv(_XYZ_FROM_RGB)
+_WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+
+
+def _lab_f(t):
+    return np.where(t > (6 / 29) ** 3, np.cbrt(t), t / (3 * (6 / 29) ** 2) + 4 / 29)
+
+
+def _lab_f_inv(t):
+    return np.where(t > 6 / 29, t ** 3, 3 * (6 / 29) ** 2 * (t - 4 / 29))
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert RGB (..., 3) in 0 - 255 to CIE L*a*b* (..., 3) under D65
+
+    :param rgb: Array of RGB Values
+    :return: np.ndarray(float64)
+    """
+    xyz = _lab_f((rgb_to_linear(rgb) @ _XYZ_FROM_RGB.T) / _WHITE_D65)
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+    return np.stack([116 * y - 16, 500 * (x - y), 200 * (y - z)], axis=-1)
+
+
+def lab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    """
+    Convert CIE L*a*b* (..., 3) under D65 to RGB (..., 3) in 0 - 255
+
+    :param lab: Array of L*a*b* Values
+    :return: np.ndarray(float64)
+    """
+    lab = np.asarray(lab, dtype=np.float64)
+    y = (lab[..., 0] + 16) / 116
+    xyz = np.stack([y + lab[..., 1] / 500, y, y - lab[..., 2] / 200], axis=-1)
+    return linear_to_rgb((_lab_f_inv(xyz) * _WHITE_D65) @ _RGB_FROM_XYZ.T)
+
+
+SPACES = {
+    "rgb": (lambda x: np.asarray(x, dtype=np.float64), lambda x: np.asarray(x, dtype=np.float64)),
+    "hsl": (rgb_to_hsl, hsl_to_rgb),
+    "hsv": (rgb_to_hsv, hsv_to_rgb),
+    "oklab": (rgb_to_oklab, oklab_to_rgb),
+    "lab": (rgb_to_lab, lab_to_rgb),
+}
+
+
+def to_space(rgb: np.ndarray, space: str = "rgb") -> np.ndarray:
+    """
+    Convert RGB (..., 3) in 0 - 255 to Color Space
+
+    :param rgb: Array of RGB Values
+    :param space: Color Space Name ("rgb", "hsl", "hsv", "oklab", "lab")
+    :return: np.ndarray(float64)
+    """
+    if space not in SPACES:
+        raise ValueError(f"Unsupported color space `{space}`. Must be one of {list(SPACES)}")
+    return SPACES[space][0](rgb)
+
+
+def from_space(values: np.ndarray, space: str = "rgb") -> np.ndarray:
+    """
+    Convert Color Space (..., 3) to RGB (..., 3) in 0 - 255
+
+    :param values: Array of Color Space Values
+    :param space: Color Space Name ("rgb", "hsl", "hsv", "oklab", "lab")
+    :return: np.ndarray(float64)
+    """
+    if space not in SPACES:
+        raise ValueError(f"Unsupported color space `{space}`. Must be one of {list(SPACES)}")
+    return SPACES[space][1](values)
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from paleta.accessibility import ContrastAnalysis, contrast_ratio, relative_luminance, WCAG_AA, WCAG_AAA, \
+    CVDAnalysis, CVD_TYPES, cvd_matrix, screen_palettes, simulate_cvd
+from paleta.color import Color
+from paleta.palette import Palette
+
+
+@pytest.fixture
+def palette_object():
+    return Palette(
+        Color.from_hex("#000"),
+        Color.from_hex("#fff"),
+        Color.from_hex("#777"),
+        Color.from_hex("#531380"),
+        Color.from_hex("#f8c630"),
+    )
+
+
+def test_relative_luminance():
+    assert relative_luminance(np.array([[0, 0, 0], [255, 255, 255]])).tolist() == [0.0, 1.0]
+    assert contrast_ratio(Color.from_hex("000"), Color.from_hex("fff")) == pytest.approx(21.0)
+    assert contrast_ratio(Color.from_hex("777"), Color.from_hex("fff")) == pytest.approx(4.48, abs=0.01)
+    assert contrast_ratio((1, 2, 3), (1, 2, 3)) == 1.0
+
+
+def test_contrast_matrix(palette_object):
+    analysis = ContrastAnalysis(palette_object)
+    matrix = analysis.matrix
+
+    assert matrix.shape == (5, 5)
+    assert np.allclose(matrix, matrix.T)
+    assert np.allclose(np.diag(matrix), 1.0)
+
+    for i, ca in enumerate(analysis.colors):
+        for j, cb in enumerate(analysis.colors):
+            assert matrix[i, j] == pytest.approx(contrast_ratio(ca, cb))
+
+
+@pytest.mark.parametrize("threshold", [1.0, 3.0, WCAG_AA, WCAG_AAA, 21.0, 22.0])
+def test_contrast_pairs(palette_object, threshold):
+    analysis = ContrastAnalysis(palette_object)
+    rows, cols = np.triu_indices(len(analysis.colors), 1)
+    expected = {(i, j) for i, j in zip(rows, cols) if analysis.matrix[i, j] >= threshold}
+
+    passing = {tuple(p) for p in analysis.pairs(threshold).tolist()}
+    failing = {tuple(p) for p in analysis.pairs(threshold, passing=False).tolist()}
+
+    assert passing == expected
+    assert failing == set(zip(rows.tolist(), cols.tolist())) - expected
+    assert analysis.count(threshold) == len(expected)
+
+
+def test_contrast_passing_failing(palette_object):
+    analysis = ContrastAnalysis(palette_object)
+
+    passing = analysis.passing(WCAG_AA)
+    assert all(ratio >= WCAG_AA for _, _, ratio in passing)
+    assert any({ca, cb} == {Color.from_hex("000"), Color.from_hex("fff")} for ca, cb, _ in passing)
+
+    failing = analysis.failing(WCAG_AA)
+    assert all(ratio < WCAG_AA for _, _, ratio in failing)
+    assert len(passing) + len(failing) == 10
+
+    assert ContrastAnalysis(Palette()).passing() == []
+
+
+def test_simulate_cvd():
+    rgba = np.random.default_rng(0).integers(0, 256, (500, 4)).astype(np.uint8)
+
+    assert np.array_equal(simulate_cvd(rgba, "protanopia", severity=0), rgba)
+    gray = simulate_cvd(rgba, "achromatopsia")
+    assert np.all(gray[:, 0] == gray[:, 1]) and np.all(gray[:, 1] == gray[:, 2])
+    assert np.array_equal(gray[:, 3], rgba[:, 3])
+
+    # Red and green both fall onto the yellow side of the blue-yellow axis for red-green deficiencies
+    for deficiency in ("protanopia", "deuteranopia"):
+        simulated = simulate_cvd(np.array([[255, 0, 0, 255], [0, 255, 0, 255]], dtype=np.uint8), deficiency)
+        r, g, b = simulated[:, 0].astype(int), simulated[:, 1].astype(int), simulated[:, 2].astype(int)
+        assert np.all(np.abs(r - g) < 30) and np.all(g > b)
+
+    with pytest.raises(ValueError):
+        simulate_cvd(rgba, "monochrome")
+    with pytest.raises(ValueError):
+        cvd_matrix("protanopia", severity=2)
+
+
+def test_cvd_analysis():
+    colors = [Color(200, 60, 60), Color(110, 110, 60), Color(40, 40, 200), Color(255, 255, 255)]
+    analysis = CVDAnalysis(colors)
+
+    assert len(analysis.simulated("tritanopia")) == 4
+    assert analysis.indistinguishable("achromatopsia") == [(colors[0], colors[1])]
+    assert set(analysis.report()) == set(CVD_TYPES)
+    assert analysis.report(["achromatopsia"]) == {"achromatopsia": 1}
+    assert CVDAnalysis(colors, severity=0).report() == {deficiency: 0 for deficiency in CVD_TYPES}
+
+
+def test_screen_palettes():
+    rng = np.random.default_rng(0)
+    palettes = [[Color(*c) for c in rng.integers(0, 256, (n, 3)).tolist()] for n in (2, 16, 5, 1, 24)]
+    palettes.append([])
+
+    results = screen_palettes(palettes)
+    assert len(results) == len(palettes)
+    for palette, result in zip(palettes, results):
+        for deficiency in CVD_TYPES:
+            assert np.array_equal(result[deficiency], CVDAnalysis(palette).pairs(deficiency))
+    assert screen_palettes([]) == []
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from paleta.adjust import adjust_array, adjust_conversion
+from paleta.color import Color
+from paleta.palette import ConversionPalette
+
+
+def test_adjust_array_identity():
+    rgba = np.random.default_rng(0).integers(0, 256, (1000, 4)).astype(np.uint8)
+
+    for space in ("hsl", "hsv"):
+        assert np.array_equal(adjust_array(rgba, space=space), rgba)
+
+
+def test_adjust_array():
+    rgba = np.array([[255, 0, 0, 200], [128, 128, 128, 255]], dtype=np.uint8)
+
+    assert adjust_array(rgba, hue=120)[0].tolist() == [0, 255, 0, 200]
+    assert adjust_array(rgba, hue=-120)[0].tolist() == [0, 0, 255, 200]
+    assert adjust_array(rgba, saturation=0)[0].tolist() == [128, 128, 128, 200]
+    assert adjust_array(rgba, lightness=0)[1].tolist() == [0, 0, 0, 255]
+    assert adjust_array(rgba, lightness=10)[1].tolist() == [255, 255, 255, 255]
+    assert adjust_array(rgba, lightness=0.5, space="hsv")[0].tolist() == [128, 0, 0, 200]
+
+    with pytest.raises(ValueError):
+        adjust_array(rgba, space="oklab")
+
+
+def test_adjust_conversion():
+    colors = [Color(255, 0, 0), Color(0, 0, 255)]
+    cmap = adjust_conversion(colors, hue=120)
+
+    assert isinstance(cmap, ConversionPalette)
+    assert cmap.to_dict() == {(255, 0, 0, 255): (0, 255, 0, 255), (0, 0, 255, 255): (255, 0, 0, 255)}
+    assert len(adjust_conversion([])) == 0
@@ -0,0 +1,53 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from paleta.cache import ConversionCache
+
+
+@pytest.fixture
+def cache_object(tmp_path):
+    return ConversionCache(str(tmp_path / "cache"), max_bytes=250)
+
+
+def test_cache_key():
+    pixels = np.zeros((2, 2, 4), dtype=np.uint8)
+
+    assert ConversionCache.key(pixels, "a") == ConversionCache.key(pixels.copy(), "a")
+    assert ConversionCache.key(pixels, "a") != ConversionCache.key(pixels, "b")
+    assert ConversionCache.key(pixels) != ConversionCache.key(pixels.reshape(4, 4))
+    assert ConversionCache.key(pixels, fmt=".png") != ConversionCache.key(pixels, fmt=".gif")
+    assert ConversionCache.key(a=1, b=2) == ConversionCache.key(b=2, a=1)
+
+    with pytest.raises(TypeError):
+        ConversionCache.key(1.0)
+
+
+def test_cache_get_put(cache_object):
+    assert cache_object.get("missing") is None
+
+    cache_object.put("a", b"content")
+    assert "a" in cache_object
+    assert cache_object.get("a") == b"content"
+    assert cache_object.size() == len(b"content")
+
+    cache_object.clear()
+    assert "a" not in cache_object
+
+
+def test_cache_lru_eviction(cache_object):
+    cache_object.put("a", b"a" * 100)
+    cache_object.put("b", b"b" * 100)
+
+    past = time.time() - 10
+    os.utime(cache_object.path("a"), (past, past))
+    os.utime(cache_object.path("b"), (past - 10, past - 10))
+    cache_object.get("b")  # Mark b as recently used
+
+    cache_object.put("c", b"c" * 100)
+    assert "a" not in cache_object
+    assert "b" in cache_object
+    assert "c" in cache_object
+    assert cache_object.size() <= cache_object.max_bytes
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from paleta.cluster import cluster_palettes, hausdorff_distance, palette_signature
+from paleta.color import Color
+from paleta.palette import Palette
+
+
+@pytest.fixture
+def collection():
+    rng = np.random.default_rng(0)
+    palettes = []
+    for _ in range(40):
+        base = rng.integers(0, 256, (8, 3))
+        palettes.append([Color(*c) for c in base.tolist()])
+        shaded = np.clip(base + rng.integers(-2, 3, base.shape), 0, 255)
+        palettes.append(Palette(*(Color(*c) for c in shaded.tolist())))
+    return palettes
+
+
+def test_hausdorff_distance():
+    pa = [Color(0, 0, 0), Color(255, 255, 255)]
+    pb = [Color(0, 0, 0), Color(255, 255, 255), Color(250, 250, 250)]
+
+    assert hausdorff_distance(pa, pa) == 0
+    assert hausdorff_distance(pa, pb) == hausdorff_distance(pb, pa)
+    assert hausdorff_distance(pa, pb, space="rgb") == pytest.approx(np.sqrt(75))
+    assert hausdorff_distance([], []) == 0 and hausdorff_distance(pa, []) == np.inf
+
+
+def test_palette_signature_bound(collection):
+    signatures = palette_signature(collection)
+    assert signatures.shape == (len(collection), 33)
+
+    for i, j in [(0, 1), (0, 2), (5, 30)]:
+        bound = np.abs(signatures[i] - signatures[j]).max()
+        assert bound <= hausdorff_distance(collection[i], collection[j]) + 1e-12
+
+
+def test_cluster_palettes(collection):
+    clusters = cluster_palettes(collection, threshold=0.03)
+
+    assert len(clusters) == 40
+    assert sorted(sorted(c) for c in clusters.clusters()) == [[i, i + 1] for i in range(0, 80, 2)]
+    assert len(clusters.unique()) == 40 and len(clusters.duplicates()) == 40
+    assert clusters.candidates < len(collection) * (len(collection) - 1) // 2
+
+    for i, label in enumerate(clusters.labels.tolist()):
+        rep = clusters.representatives[label]
+        assert hausdorff_distance(collection[i], collection[rep]) <= 0.03
+
+
+def test_cluster_palettes_brute_force(collection):
+    threshold = 0.3
+    clusters = cluster_palettes(collection, threshold=threshold)
+
+    expected = {
+        (i, j) for i in range(len(collection)) for j in range(i + 1, len(collection))
+        if hausdorff_distance(collection[i], collection[j]) <= threshold
+    }
+    assert {tuple(p) for p in np.sort(clusters.pairs, axis=1).tolist()} == expected
+
+
+def test_cluster_palettes_edge_cases():
+    assert len(cluster_palettes([])) == 0
+
+    clusters = cluster_palettes([[Color(1, 2, 3)], [], [Color(1, 2, 3)]])
+    assert clusters.clusters() == [[0, 2], [1]]
+
+    with pytest.raises(ValueError):
+        cluster_palettes([[Color(1, 2, 3)]], space="hsl")
@@ -0,0 +1,530 @@
+import os
+
+import numpy as np
+import pytest
+
+from PIL import Image
+
+from paleta.accessibility import simulate_cvd
+from paleta.array import pack_colors, pack_rgba
+from paleta.cache import ConversionCache
+from paleta.color import Color
+from paleta.palette import Palette, ConversionPalette
+from paleta.image import (
+    extract_palette, extract_palette_ext, extract_palette_sample, convert_palette, convert_regions, convert_batch,
+    convert_palette_dedup, extract_convert_palette, gradient_map, adjust_image, opaque_bbox, simulate_cvd_image,
+    load_pixels, IndexedImage, RawImage,
+)
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    f = tmp_path / "sprite.png"
+
+    image = Image.new("RGBA", (16, 40), (0, 0, 0, 0))
+    for y in range(40):
+        for x in range(16):
+            if (x + y) % 3 == 0:
+                image.putpixel((x, y), (83, 19, 128, 255))
+            elif (x + y) % 3 == 1:
+                image.putpixel((x, y), (215, 130, 14, 255))
+    image.save(f)
+
+    return str(f)
+
+
+def test_extract_palette_ext(image_file):
+    expected = Palette(Color(83, 19, 128), Color(215, 130, 14))
+
+    assert extract_palette_ext(image_file) == expected
+    assert extract_palette_ext(image_file, workers=4, tile_rows=7) == expected
+    assert len(extract_palette_ext(image_file, alpha_threshold=-1)) == 3
+    assert extract_palette_ext(image_file).color_set <= extract_palette(image_file).color_set
+
+
+def test_convert_palette(image_file, tmp_path):
+    cmap = ConversionPalette({Color(83, 19, 128): Color(96, 208, 72)})
+    f_out = str(tmp_path / "out.png")
+
+    convert_palette(image_file, cmap, f_out=f_out)
+    out = Image.open(f_out)
+    assert out.getpixel((0, 0)) == (96, 208, 72, 255)
+    assert out.getpixel((1, 0)) == (215, 130, 14, 255)
+    assert out.getpixel((2, 0)) == (0, 0, 0, 0)
+
+
+def test_convert_palette_workers(image_file, tmp_path):
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255), (0, 0, 0, 0): (1, 2, 3, 4)}
+    f_serial = str(tmp_path / "serial.png")
+    f_tiled = str(tmp_path / "tiled.png")
+
+    convert_palette(image_file, cmap, f_out=f_serial)
+    convert_palette(image_file, cmap, f_out=f_tiled, workers=3, tile_rows=5)
+    assert list(Image.open(f_serial).getdata()) == list(Image.open(f_tiled).getdata())
+    assert Image.open(f_tiled).getpixel((2, 0)) == (1, 2, 3, 4)
+
+
+@pytest.fixture
+def sparse_pixels():
+    pixels = np.zeros((40, 30, 4), dtype=np.uint8)
+    pixels[10:20, 5:12] = (83, 19, 128, 255)
+    pixels[12, 6] = (83, 19, 128, 100)
+    pixels[15, 8] = (215, 130, 14, 100)
+    return pixels
+
+
+def test_opaque_bbox(sparse_pixels):
+    assert opaque_bbox(sparse_pixels) == (5, 10, 12, 20)
+    assert opaque_bbox(sparse_pixels, alpha_threshold=255) is None
+    assert opaque_bbox(np.zeros((4, 4, 4), dtype=np.uint8)) is None
+
+
+def test_extract_palette_ext_translucent(sparse_pixels):
+    assert len(extract_palette_ext(sparse_pixels)) == 3
+    assert extract_palette_ext(sparse_pixels, translucent="skip") == Palette(Color(83, 19, 128))
+    assert extract_palette_ext(sparse_pixels, translucent="opaque") == Palette(Color(83, 19, 128), Color(215, 130, 14))
+    assert extract_palette_ext(sparse_pixels, alpha_threshold=100, workers=2, tile_rows=3) == Palette(Color(83, 19, 128))
+
+    with pytest.raises(ValueError):
+        extract_palette_ext(sparse_pixels, translucent="blend")
+
+
+def test_convert_palette_sparse(sparse_pixels):
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255), (215, 130, 14, 255): (1, 2, 3, 255)}
+    full = np.empty_like(sparse_pixels)
+    convert_palette(sparse_pixels, cmap, full)
+    assert tuple(full[10, 5]) == (96, 208, 72, 255)
+    assert tuple(full[12, 6]) == (83, 19, 128, 100)
+    assert np.array_equal(full[:10], sparse_pixels[:10])
+
+    opaque = np.empty_like(sparse_pixels)
+    convert_palette(sparse_pixels, cmap, opaque, translucent="opaque", workers=2, tile_rows=4)
+    assert tuple(opaque[12, 6]) == (96, 208, 72, 100)
+    assert tuple(opaque[15, 8]) == (1, 2, 3, 100)
+    assert tuple(opaque[10, 5]) == (96, 208, 72, 255)
+
+    cmap[(83, 19, 128, 100)] = (0, 0, 0, 0)
+    skip = np.empty_like(sparse_pixels)
+    convert_palette(sparse_pixels, cmap, skip, translucent="skip")
+    assert tuple(skip[12, 6]) == (83, 19, 128, 100)
+    assert tuple(skip[10, 5]) == (96, 208, 72, 255)
+
+    # Transparent keys are still converted unless a threshold leaves them unchanged
+    cmap[(0, 0, 0, 0)] = (9, 9, 9, 9)
+    convert_palette(sparse_pixels, cmap, full)
+    assert tuple(full[0, 0]) == (9, 9, 9, 9)
+    convert_palette(sparse_pixels, cmap, full, alpha_threshold=0)
+    assert tuple(full[0, 0]) == (0, 0, 0, 0)
+    assert tuple(full[12, 6]) == (0, 0, 0, 0)
+
+    # Translucent handling leaves fully transparent pixels to the mapping
+    for translucent in ("skip", "opaque"):
+        convert_palette(sparse_pixels, cmap, full, translucent=translucent, workers=2, tile_rows=4)
+        assert tuple(full[0, 0]) == (9, 9, 9, 9)
+        assert tuple(full[10, 5]) == (96, 208, 72, 255)
+    assert tuple(full[12, 6]) == (96, 208, 72, 100)
+    assert Color(0, 0, 0, 0) in extract_palette_ext(sparse_pixels, alpha_threshold=-1, translucent="opaque")
+
+
+def test_convert_palette_stats(sparse_pixels):
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255), (1, 1, 1, 255): (96, 208, 72, 255), (7, 7, 7, 255): (0, 0, 0, 255)}
+    out = np.empty_like(sparse_pixels)
+
+    stats = convert_palette(sparse_pixels, cmap, out, stats=True, workers=2, tile_rows=3)
+    assert stats.to_dict() == {
+        "pixels": 1200, "mapped": 68, "unmapped": 2, "unmapped_colors": 2, "unused_entries": 2,
+        "transparent": 1130, "skipped": 0,
+    }
+    assert set(stats.unmapped_colors()) == {Color(83, 19, 128, 100), Color(215, 130, 14, 100)}
+    assert dict(zip(stats.targets.tolist(), stats.target_counts.tolist()))[pack_colors([(96, 208, 72, 255)])[0]] == 68
+
+    plain = np.empty_like(sparse_pixels)
+    assert convert_palette(sparse_pixels, cmap, plain) is None
+    assert np.array_equal(out, plain)
+
+    stats = convert_palette(sparse_pixels, cmap, out, stats=True, translucent="skip")
+    assert (stats.mapped, stats.skipped, len(stats.unmapped)) == (68, 2, 0)
+
+    cmap[(0, 0, 0, 0)] = (9, 9, 9, 9)
+    stats = convert_palette(sparse_pixels, cmap, out, stats=True)
+    assert (stats.mapped, stats.transparent) == (1198, 0)
+
+
+def test_gradient_map(tmp_path):
+    f = str(tmp_path / "gray.png")
+    image = Image.new("RGBA", (256, 4), (0, 0, 0, 255))
+    for x in range(256):
+        image.putpixel((x, 0), (x, x, x, 255))
+        image.putpixel((x, 1), (x, x, x, 128))
+    image.putpixel((0, 2), (83, 19, 128, 255))
+    image.save(f)
+
+    colors = [Color(0, 0, 64), Color(255, 128, 0), Color(255, 255, 200)]
+    f_out = str(tmp_path / "out.png")
+    gradient_map(f, colors, f_out=f_out)
+
+    out = np.asarray(Image.open(f_out))
+    assert tuple(out[0, 0]) == (0, 0, 64, 255)
+    assert tuple(out[0, 255]) == (255, 255, 200, 255)
+    assert tuple(out[1, 0]) == (0, 0, 64, 128)
+
+    level = round(Color(83, 19, 128).to_lightness())
+    assert np.array_equal(out[2, 0], out[0, level])
+
+    f_bands = str(tmp_path / "bands.png")
+    gradient_map(f, colors, f_out=f_bands, smooth=False, workers=2, tile_rows=1)
+    bands = {tuple(c) for c in np.asarray(Image.open(f_bands))[0].tolist()}
+    assert bands == {c.irgba for c in colors}
+
+
+def test_adjust_image(image_file, tmp_path):
+    f_out = str(tmp_path / "out.png")
+    adjust_image(image_file, f_out=f_out, hue=180)
+
+    out = Image.open(f_out)
+    assert out.getpixel((0, 0)) == (64, 128, 19, 255)
+    assert out.getpixel((2, 0)) == (0, 0, 0, 0)
+
+    pixels = np.random.default_rng(0).integers(0, 256, (30, 20, 4)).astype(np.uint8)
+    table, tiled = np.empty_like(pixels), np.empty_like(pixels)
+    adjust_image(pixels, table, hue=40, saturation=0.5, lightness=1.2, space="hsv", method="table")
+    adjust_image(pixels, tiled, hue=40, saturation=0.5, lightness=1.2, space="hsv", method="pixels", workers=3,
+                 tile_rows=7)
+    assert np.array_equal(table, tiled)
+
+    with pytest.raises(ValueError):
+        adjust_image(pixels, table, method="gpu")
+
+
+def test_simulate_cvd_image(image_file, tmp_path):
+    f_out = str(tmp_path / "out.png")
+    simulate_cvd_image(image_file, "achromatopsia", f_out=f_out)
+
+    out = np.asarray(Image.open(f_out))
+    visible = out[..., 3] > 0
+    assert np.all(out[visible][:, 0] == out[visible][:, 1])
+    assert tuple(out[0, 2]) == (0, 0, 0, 0)
+
+    pixels = load_pixels(image_file)
+    tiled = np.empty_like(pixels)
+    simulate_cvd_image(pixels, "protanopia", tiled, workers=3, tile_rows=7)
+    assert np.array_equal(tiled, simulate_cvd(pixels, "protanopia"))
+
+    with pytest.raises(ValueError):
+        simulate_cvd_image(pixels, "monochrome", tiled)
+
+
+def test_indexed_image(image_file, tmp_path):
+    pixels = load_pixels(image_file)
+    indexed = IndexedImage.from_image(image_file, workers=3, tile_rows=7)
+
+    assert len(indexed) == 3
+    assert indexed.shape == pixels.shape
+    assert indexed.indices.dtype == np.uint8
+    assert np.array_equal(indexed.to_pixels(workers=3, tile_rows=7), pixels)
+    assert indexed.to_palette() == Palette(Color(83, 19, 128), Color(215, 130, 14))
+    assert indexed.counts().sum() == pixels.shape[0] * pixels.shape[1]
+
+    cmap = ConversionPalette({Color(83, 19, 128): Color(0, 255, 0), Color(0, 0, 0, 0): Color(9, 9, 9)})
+    expected = np.empty_like(pixels)
+    convert_palette(pixels, cmap, expected)
+
+    out = np.empty_like(pixels)
+    indexed.convert(cmap, out, workers=2, tile_rows=5)
+    assert np.array_equal(out, expected)
+    assert np.shares_memory(indexed.remap(cmap).indices, indexed.indices)
+    assert np.array_equal(indexed.remap([cmap, {(0, 255, 0, 255): (1, 2, 3, 255)}]).to_pixels()[0, 0], (1, 2, 3, 255))
+
+    f = str(tmp_path / "indexed.npz")
+    indexed.save(f)
+    loaded = IndexedImage.load(f)
+    assert np.array_equal(loaded.indices, indexed.indices)
+    assert np.array_equal(loaded.colors, indexed.colors)
+
+    with pytest.raises(ValueError):
+        IndexedImage(np.array([[0, 3]], dtype=np.uint8), indexed.colors)
+    with pytest.raises(ValueError):
+        IndexedImage(np.zeros((2, 2), dtype=np.int64), indexed.colors)
+
+
+def test_convert_palette_strided_output(image_file):
+    pixels = load_pixels(image_file)
+    cmap = {(83, 19, 128, 255): (0, 255, 0, 255)}
+
+    # Writes through a packed view would land in a temporary copy
+    wide = np.zeros(pixels.shape[:1] + (pixels.shape[1] * 2, 4), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        convert_palette(pixels, cmap, wide[:, ::2])
+    assert not wide.any()
+
+    # In place as well
+    wide[:, ::2] = pixels
+    with pytest.raises(ValueError):
+        convert_palette(wide[:, ::2], cmap)
+    assert np.array_equal(wide[:, ::2], pixels)
+
+    with pytest.raises(ValueError):
+        pack_rgba(wide[:, ::2], view=True)
+    assert np.shares_memory(pack_rgba(wide, view=True), wide)
+
+
+def test_extract_palette_sample(tmp_path):
+    f = str(tmp_path / "photo.png")
+    image = Image.new("RGBA", (200, 100), (255, 0, 0, 255))
+    image.paste((0, 0, 255, 255), (0, 0, 50, 100))
+    image.paste((0, 0, 0, 0), (190, 0, 200, 100))
+    image.save(f)
+
+    for method in ("random", "stride"):
+        estimate = extract_palette_sample(f, k=1, sample_size=4000, method=method)
+        assert len(estimate) == 1
+        assert estimate.colors[0] == Color(255, 0, 0)
+        assert abs(estimate.frequencies[0] - 140 / 190) <= estimate.error_bound(0.99)
+
+    estimate = extract_palette_sample(f, sample_size=4000, seed=1)
+    assert estimate.to_palette() == Palette(Color(255, 0, 0), Color(0, 0, 255))
+    assert estimate.frequencies.sum() == pytest.approx(1.0)
+    assert estimate.error_bound(0.99) > estimate.error_bound(0.9)
+    assert np.all(estimate.stderr < 0.02)
+    assert extract_palette_sample(f, seed=1).counts.tolist() == extract_palette_sample(f, seed=1).counts.tolist()
+
+    with pytest.raises(ValueError, match="stride"):
+        extract_palette_sample(f, method="kmeans")
+
+    # The stride grid never reads more than the sample size
+    pixels = np.full((100, 200, 4), 255, dtype=np.uint8)
+    for sample_size in (5128, 4000, 20000):
+        assert extract_palette_sample(pixels, sample_size=sample_size, method="stride").sample_size <= sample_size
+
+
+def test_extract_palette_sample_draft(tmp_path):
+    f = str(tmp_path / "photo.jpg")
+    Image.new("RGB", (1024, 1024), (0, 128, 255)).save(f)
+
+    estimate = extract_palette_sample(f, k=1, sample_size=1000)
+    assert estimate.image_size == (1024, 1024)
+    assert estimate.sample_size == 1000
+    assert abs(estimate.colors[0].r - 0) <= 4 and abs(estimate.colors[0].b - 255) <= 4
+
+
+def test_convert_palette_cache(image_file, tmp_path):
+    cache = ConversionCache(str(tmp_path / "cache"))
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255)}
+    f_out = str(tmp_path / "out.png")
+
+    convert_palette(image_file, cmap, f_out=f_out, cache=cache)
+    assert len(cache.entries()) == 1
+    expected = list(Image.open(f_out).getdata())
+
+    os.remove(f_out)
+    convert_palette(image_file, cmap, f_out=f_out, cache=cache)
+    assert len(cache.entries()) == 1
+    assert list(Image.open(f_out).getdata()) == expected
+
+    convert_palette(image_file, {(83, 19, 128, 255): (0, 0, 0, 255)}, f_out=f_out, cache=cache)
+    assert len(cache.entries()) == 2
+    assert Image.open(f_out).getpixel((0, 0)) == (0, 0, 0, 255)
+
+
+def test_extract_convert_palette_cache(image_file, tmp_path):
+    cache = ConversionCache(str(tmp_path / "cache"))
+    f_palette = str(tmp_path / "palette.png")
+    f_out = str(tmp_path / "out.png")
+    Image.new("RGBA", (2, 1), (255, 255, 255, 255)).save(f_palette)
+
+    extract_convert_palette(image_file, f_palette, f_out=f_out, cache=cache)
+    extract_convert_palette(image_file, f_palette, f_out=f_out, cache=cache)
+    assert len(cache.entries()) == 1
+    assert Image.open(f_out).getpixel((0, 0)) == (255, 255, 255, 255)
+
+    # Checked before the cache is consulted
+    with pytest.raises(ValueError, match="min_distance"):
+        extract_convert_palette(image_file, f_palette, f_out=f_out, method="kmeans", cache=cache)
+
+
+def test_convert_regions(image_file, tmp_path):
+    f_out = str(tmp_path / "out.png")
+    purple, orange = (83, 19, 128, 255), (215, 130, 14, 255)
+
+    convert_regions(image_file, [
+        ((0, 0, 16, 20), {purple: (255, 255, 255, 255)}),
+        ((0, 20, 16, 40), ConversionPalette({Color(*purple): Color(0, 0, 0)})),
+        ((0, 0, 3, 3), {orange: (1, 1, 1, 255)}),
+    ], f_out=f_out)
+
+    out = Image.open(f_out)
+    assert out.getpixel((5, 1)) == (255, 255, 255, 255)
+    assert out.getpixel((0, 0)) == purple  # Later box wins where boxes overlap
+    assert out.getpixel((1, 0)) == (1, 1, 1, 255)
+    assert out.getpixel((4, 0)) == orange
+    assert out.getpixel((1, 20)) == (0, 0, 0, 255)
+
+    with pytest.raises(ValueError):
+        convert_regions(image_file, [((0, 0, 17, 1), {})], f_out=f_out)
+
+
+def test_convert_regions_mask(image_file, tmp_path):
+    f_out = str(tmp_path / "out.png")
+    f_mask = str(tmp_path / "mask.png")
+    purple = (83, 19, 128, 255)
+
+    mask = Image.new("L", (16, 40), 0)
+    mask.paste(1, (0, 0, 8, 40))
+    mask.paste(2, (8, 0, 16, 40))
+    mask.save(f_mask)
+
+    cmaps = {1: {purple: (255, 0, 0, 255)}, 2: {purple: (0, 255, 0, 255)}, 3: {purple: (0, 0, 0, 255)}}
+    convert_regions(image_file, f_out=f_out, mask=f_mask, cmaps=cmaps)
+
+    out = Image.open(f_out)
+    assert out.getpixel((0, 0)) == (255, 0, 0, 255)
+    assert out.getpixel((9, 0)) == (0, 255, 0, 255)
+    assert out.getpixel((1, 0)) == (215, 130, 14, 255)
+
+    with pytest.raises(ValueError):
+        convert_regions(image_file, f_out=f_out, mask=np.zeros((2, 2)), cmaps=cmaps)
+
+
+def test_load_pixels(image_file, tmp_path):
+    expected = np.asarray(Image.open(image_file).convert("RGBA"))
+
+    f_raw = str(tmp_path / "sprite.rgba")
+    expected.tofile(f_raw)
+    f_npy = str(tmp_path / "sprite.npy")
+    np.save(f_npy, expected)
+
+    for source in (image_file, RawImage(f_raw, (40, 16)), f_npy, expected):
+        assert np.array_equal(load_pixels(source), expected)
+
+    assert isinstance(load_pixels(f_npy), np.memmap)
+    assert isinstance(load_pixels(RawImage(f_raw, (40, 16))), np.memmap)
+    assert extract_palette_ext(f_npy) == extract_palette_ext(image_file)
+    assert extract_palette_sample(RawImage(f_raw, (40, 16)), k=2).to_palette() == extract_palette_ext(image_file)
+
+    with pytest.raises(ValueError):
+        load_pixels(np.zeros((4, 4, 3), dtype=np.uint8))
+
+
+def test_convert_palette_mapped(image_file, tmp_path):
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255)}
+    f_png = str(tmp_path / "out.png")
+    convert_palette(image_file, cmap, f_out=f_png)
+    expected = np.asarray(Image.open(f_png))
+
+    f_raw = str(tmp_path / "sprite.rgba")
+    np.asarray(Image.open(image_file).convert("RGBA")).tofile(f_raw)
+    f_npy = str(tmp_path / "out.npy")
+
+    # Raw to mapped .npy output
+    convert_palette(RawImage(f_raw, (40, 16)), cmap, f_out=f_npy)
+    assert np.array_equal(np.load(f_npy), expected)
+
+    # Raw to raw output, and raw converted in place
+    f_raw_out = str(tmp_path / "out.rgba")
+    convert_palette(RawImage(f_raw, (40, 16)), cmap, f_out=RawImage(f_raw_out, (40, 16)))
+    assert np.array_equal(np.fromfile(f_raw_out, dtype=np.uint8).reshape(40, 16, 4), expected)
+
+    convert_palette(RawImage(f_raw, (40, 16)), cmap)
+    assert np.array_equal(np.fromfile(f_raw, dtype=np.uint8).reshape(40, 16, 4), expected)
+
+    # Array converted in place, and mapped input to encoded output
+    pixels = np.asarray(Image.open(image_file).convert("RGBA")).copy()
+    convert_palette(pixels, cmap)
+    assert np.array_equal(pixels, expected)
+
+    convert_palette(f_npy, {(96, 208, 72, 255): (0, 0, 0, 255)}, f_out=f_png)
+    assert Image.open(f_png).getpixel((0, 0)) == (0, 0, 0, 255)
+
+    with pytest.raises(ValueError):
+        convert_palette(f_npy, cmap, f_out=RawImage(f_raw_out, (2, 2)))
+
+
+def test_convert_palette_mapped_cache(image_file, tmp_path):
+    cache = ConversionCache(str(tmp_path / "cache"))
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255)}
+    f_npy = str(tmp_path / "out.npy")
+
+    convert_palette(image_file, cmap, f_out=f_npy, cache=cache)
+    expected = np.load(f_npy)
+    os.remove(f_npy)
+
+    convert_palette(image_file, cmap, f_out=f_npy, cache=cache)
+    assert len(cache.entries()) == 1
+    assert np.array_equal(np.load(f_npy), expected)
+
+
+def test_convert_batch(image_file, tmp_path):
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255)}
+    f_expected = str(tmp_path / "expected.png")
+    convert_palette(image_file, cmap, f_out=f_expected)
+    expected = np.asarray(Image.open(f_expected))
+
+    jobs = [(image_file, str(tmp_path / f"out_{i}.png")) for i in range(12)]
+    jobs.append((str(tmp_path / "missing.png"), str(tmp_path / "missing_out.png")))
+    jobs.append((image_file, str(tmp_path / "out.npy")))
+
+    errors = convert_batch(jobs, cmap, decoders=2, encoders=3, queue_size=1)
+    assert len(errors) == len(jobs)
+    assert isinstance(errors[12], FileNotFoundError)
+    assert errors[:12] == [None] * 12 and errors[13] is None
+
+    for _, f_out in jobs[:12]:
+        assert np.array_equal(np.asarray(Image.open(f_out)), expected)
+    assert np.array_equal(np.load(str(tmp_path / "out.npy")), expected)
+    assert convert_batch([], cmap) == []
+
+
+def test_convert_batch_in_place(image_file):
+    pixels = [np.asarray(Image.open(image_file).convert("RGBA")).copy() for _ in range(3)]
+
+    assert convert_batch(pixels, {(83, 19, 128, 255): (0, 0, 0, 255)}, encoders=1) == [None] * 3
+    assert all(tuple(p[0, 0]) == (0, 0, 0, 255) for p in pixels)
+
+
+def test_convert_palette_chain(image_file, tmp_path):
+    purple = (83, 19, 128, 255)
+    steps = [{purple: (1, 1, 1, 255)}, ConversionPalette({Color(1, 1, 1): Color(2, 2, 2)}), {(2, 2, 2, 255): purple}]
+    f_out = str(tmp_path / "out.png")
+
+    convert_palette(image_file, steps[:2], f_out=f_out)
+    assert Image.open(f_out).getpixel((0, 0)) == (2, 2, 2, 255)
+
+    convert_palette(image_file, steps, f_out=f_out)
+    assert Image.open(f_out).getpixel((0, 0)) == purple
+
+
+def test_convert_palette_dedup(tmp_path):
+    f_in = str(tmp_path / "tiles.png")
+    tile_a = Image.new("RGBA", (8, 8), (83, 19, 128, 255))
+    tile_b = Image.new("RGBA", (8, 8), (215, 130, 14, 255))
+    tile_b.putpixel((3, 3), (83, 19, 128, 255))
+
+    sheet = Image.new("RGBA", (64, 36), (0, 0, 0, 0))
+    for i in range(8):
+        for j in range(4):
+            sheet.paste(tile_a if (i + j) % 4 else tile_b, (i * 8, j * 8))
+    sheet.save(f_in)
+
+    cmap = {(83, 19, 128, 255): (96, 208, 72, 255), (0, 0, 0, 0): (1, 1, 1, 1)}
+    f_expected, f_out = str(tmp_path / "expected.png"), str(tmp_path / "out.png")
+    convert_palette(f_in, cmap, f_out=f_expected)
+
+    report = convert_palette_dedup(f_in, cmap, f_out=f_out)
+    assert np.array_equal(np.asarray(Image.open(f_out)), np.asarray(Image.open(f_expected)))
+    assert report.tiles == 40
+    assert report.unique_tiles == 3
+    assert report.ratio == pytest.approx(40 / 3)
+    assert "3/40" in str(report)
+
+    report = convert_palette_dedup(f_in, cmap, f_out=f_out, tile_size=(16, 5))
+    assert np.array_equal(np.asarray(Image.open(f_out)), np.asarray(Image.open(f_expected)))
+    assert report.tile_size == (16, 5)
+
+    with pytest.raises(ValueError):
+        convert_palette_dedup(f_in, cmap, f_out=f_out, tile_size=0)
+
+    # Without a conversion palette nothing is written, as with convert_palette
+    f_none = str(tmp_path / "none.png")
+    assert convert_palette(f_in, f_out=f_none) is None
+    assert convert_palette_dedup(f_in, f_out=f_none) is None
+    assert not os.path.exists(f_none)
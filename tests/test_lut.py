@@ -0,0 +1,90 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from paleta.array import pack_rgba, pack_colors
+from paleta.color import Color
+from paleta.lut import LookupTable, SharedLookupTable, nearest_table
+from paleta.palette import Palette, ConversionPalette
+
+
+@pytest.fixture
+def palette_object():
+    return Palette(
+        Color.from_hex("#531380"),
+        Color.from_hex("#d7820e"),
+        Color.from_hex("#60d048"),
+        Color.from_hex("#f8c630"),
+    )
+
+
+def _apply_shared(args):
+    table, pixels = args
+    return table.apply(pixels), isinstance(table, SharedLookupTable)
+
+
+def test_lut_from_cmap(palette_object):
+    cmap = ConversionPalette.random(palette_object, Palette(Color.from_hex("fff")), seed=1)
+    table = LookupTable.from_cmap(cmap)
+    assert len(table) == 4
+    assert LookupTable.from_cmap(table) is table
+
+    pixels = pack_colors([Color.from_hex("#531380"), Color(1, 2, 3)])
+    assert table.apply(pixels).tolist() == pack_colors([Color.from_hex("fff"), Color(1, 2, 3)]).tolist()
+
+    assert len(LookupTable.from_cmap({(1.5, 2, 3, 255): (0, 0, 0, 255)})) == 0
+    assert LookupTable.from_cmap({}).apply(pixels).tolist() == pixels.tolist()
+
+
+def test_lut_from_nearest(palette_object):
+    target = Palette(Color.from_hex("000"), Color.from_hex("fff"))
+    table = LookupTable.from_nearest(palette_object, target)
+    cmap = LookupTable.from_cmap(ConversionPalette.map(palette_object, target))
+
+    assert table.keys.tolist() == cmap.keys.tolist()
+    assert table.values.tolist() == cmap.values.tolist()
+
+
+def test_lut_from_nearest_chunked(palette_object, monkeypatch):
+    rng = np.random.default_rng(0)
+    source = Palette(*(Color(*c, 255) for c in rng.integers(0, 256, (300, 3)).tolist()))
+    expected = LookupTable.from_nearest(source, palette_object)
+
+    # Rows of the distance matrix are processed a few at a time
+    monkeypatch.setattr("paleta.lut.BATCH_ELEMENTS", 7)
+    table = LookupTable.from_nearest(source, palette_object)
+
+    assert table.keys.tolist() == expected.keys.tolist()
+    assert table.values.tolist() == expected.values.tolist()
+
+
+def test_nearest_table_memoized(palette_object):
+    target = Palette(Color.from_hex("000"), Color.from_hex("fff"))
+    table = nearest_table(palette_object, target)
+
+    assert nearest_table(palette_object.freeze(), Palette(*target.to_list())) is table
+    assert nearest_table(target, palette_object) is not table
+    assert table.values.tolist() == LookupTable.from_nearest(palette_object, target).values.tolist()
+
+
+def test_shared_lut(palette_object):
+    table = LookupTable.from_nearest(palette_object, Palette(Color.from_hex("000"), Color.from_hex("fff")))
+    pixels = pack_rgba(np.array([[[83, 19, 128, 255], [1, 2, 3, 4]]], dtype=np.uint8))
+
+    with table.to_shared() as shared:
+        assert shared.owner
+        assert shared.keys.tolist() == table.keys.tolist()
+        assert len(pickle.dumps(shared)) < 200
+
+        attached = SharedLookupTable.attach(shared.name, len(shared))
+        assert attached is SharedLookupTable.attach(shared.name, len(shared))
+        assert not attached.keys.flags.writeable
+        assert attached.apply(pixels).tolist() == table.apply(pixels).tolist()
+        attached.close()
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            for result, is_shared in pool.map(_apply_shared, [(shared, pixels)] * 4):
+                assert is_shared
+                assert result.tolist() == table.apply(pixels).tolist()
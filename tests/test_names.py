@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from paleta.color import Color
+from paleta.palette import Palette
+from paleta.names import NameIndex, load_names, nearest_name, nearest_names
+from paleta.space import rgb_to_oklab
+
+
+def test_load_names():
+    css = load_names("css")
+    assert len(css) == 148
+    assert css["cornflowerblue"] == Color(100, 149, 237)
+    assert load_names("x11")["GhostWhite"] == Color(248, 248, 255)
+    assert load_names("xkcd")["cloudy blue"] == Color.from_hex("#acc2d9")
+
+    with pytest.raises(ValueError):
+        load_names("pantone")
+
+
+def test_nearest_name():
+    assert nearest_name(Color(100, 149, 237)) == "cornflowerblue"
+    assert nearest_name((250, 2, 3)) == "red"
+    assert Color(0, 0, 1).to_name() == "black"
+    assert Color(255, 255, 254).to_name("xkcd") == "white"
+
+    palette = Palette(Color(255, 0, 0), Color(0, 0, 255))
+    assert palette.to_names() == {"#ff0000": "red", "#0000ff": "blue"}
+
+
+def test_nearest_names_bulk():
+    colors = [Color(*c) for c in np.random.default_rng(0).integers(0, 256, (500, 3)).tolist()]
+    index = NameIndex.from_set("xkcd")
+    assert NameIndex.from_set("xkcd") is index
+
+    result = nearest_names(colors, names="xkcd")
+    assert len(result) == len(colors)
+
+    points = rgb_to_oklab(np.array([c.rgb for c in colors], dtype=np.float64))
+    dist = ((points[:, None] - index.points[None]) ** 2).sum(axis=-1)
+    chosen = dist[np.arange(len(colors)), [index.names.index(n) for n in result]]
+    assert np.allclose(chosen, dist.min(axis=1))
+
+    assert nearest_names([]) == []
+
+
+def test_name_index_custom():
+    index = NameIndex({"dark": Color(10, 10, 10), "light": (240, 240, 240)})
+    assert index.nearest([Color(0, 0, 0), Color(200, 200, 200), Color(0, 0, 0)]) == ["dark", "light", "dark"]
+    assert len(index) == 2
+
+    with pytest.raises(ValueError):
+        NameIndex({})
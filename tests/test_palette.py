@@ -1,7 +1,7 @@
 import pytest
 
 from paleta.color import Color, color_average
-from paleta.palette import Palette, ConversionPalette, maximize_by_average, minimize_by_average
+from paleta.palette import Palette, FrozenPalette, ConversionPalette, maximize_by_average, minimize_by_average
 
 
 @pytest.fixture
@@ -242,3 +242,99 @@ def test_palette_to_dict(palette_object):
 
     assert palette_object.to_dict() == {x.hex: x.rgba for x in ptl}
     assert "#d7820e" in palette_object.to_dict().keys()
+
+
+def test_conversion_palette_compose():
+    red, green, blue, white = (Color.from_hex(h) for h in ("f00", "0f0", "00f", "fff"))
+
+    ab = ConversionPalette({red: green, white: red})
+    bc = ConversionPalette({green: blue, blue: white})
+    ac = ab.compose(bc)
+
+    assert ac.to_dict() == {red.rgba: blue.rgba, white.rgba: red.rgba, green.rgba: blue.rgba, blue.rgba: white.rgba}
+    assert (ab >> bc).to_dict() == ac.to_dict()
+    assert ab.compose().to_dict() == ab.to_dict()
+    assert ab.compose(bc, {blue.rgba: green.rgba})[red] == green
+    assert len(ac) == 4
+
+    with pytest.raises(TypeError):
+        assert ab >> 1
+
+
+def test_conversion_palette_compose_matches_steps(palette_object):
+    steps = [
+        ConversionPalette.random(palette_object, palette_object, seed=3),
+        ConversionPalette.map(palette_object, Palette(Color.from_hex("000"), Color.from_hex("fff"))),
+        {(0, 0, 0, 255): (1, 2, 3, 255)},
+    ]
+    chain = ConversionPalette().compose(*steps)
+
+    for color in palette_object.color_set | {(1, 1, 1, 255)}:
+        expected = color
+        for step in steps:
+            step = step.to_dict() if isinstance(step, ConversionPalette) else step
+            expected = step.get(expected, expected)
+        assert chain.to_dict().get(color, color) == expected
+
+
+def test_frozen_palette(palette_object):
+    fp = palette_object.freeze()
+
+    assert isinstance(fp, FrozenPalette)
+    assert fp == palette_object
+    assert palette_object == fp
+    assert fp.thaw() == palette_object
+    assert fp == FrozenPalette(*palette_object.color_set)
+    assert len(fp) == len(palette_object)
+    assert (83, 19, 128, 255) in fp
+    assert Color.from_hex("#531380") in fp
+    assert Color.from_hex("fff") not in fp
+
+    with pytest.raises(ValueError):
+        FrozenPalette(1)
+
+
+def test_frozen_palette_hash(palette_object):
+    fp = palette_object.freeze()
+    cache = {fp: "cached"}
+
+    assert cache[Palette(*palette_object.to_list()[::-1]).freeze()] == "cached"
+    assert hash(fp) == hash(FrozenPalette(*fp.to_list()))
+    assert fp.fingerprint == FrozenPalette(*reversed(fp.to_list())).fingerprint
+    assert fp.fingerprint != (fp | Palette(Color.from_hex("fff"))).fingerprint
+    assert len(fp.fingerprint) == 32
+
+    # Colors handed out are new objects, changing them leaves the palette unchanged
+    original = set(palette_object.colors)
+    items, listed, as_dict = set(fp.color_set), fp.to_list(), fp.to_dict()
+    color = next(iter(fp))
+    color.r = (color.r + 1) % 256
+    listed[0].g = (listed[0].g + 1) % 256
+
+    assert {c.rgba for c in fp} == items
+    assert fp.to_dict() == as_dict
+    assert fp == original
+    assert fp == palette_object
+    assert fp.fingerprint == FrozenPalette(*original).fingerprint
+
+    with pytest.raises(AttributeError):
+        fp.extra = 1
+
+
+def test_frozen_palette_set_operations(palette_object):
+    fp = palette_object.freeze()
+    white = FrozenPalette(Color.from_hex("fff"))
+
+    assert fp | white == palette_object | Palette(Color.from_hex("fff"))
+    assert fp + palette_object == fp
+    assert fp & white == FrozenPalette()
+    assert fp - fp == FrozenPalette()
+    assert (fp | white) ^ fp == white
+    assert fp <= fp | white
+    assert fp.union(white) >= white
+    assert fp.intersection(palette_object) == fp
+    assert fp.difference(Palette()) == fp
+    assert fp.to_dict() == palette_object.to_dict()
+
+    with pytest.raises(TypeError):
+        assert fp | None
@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+import pytest
+
+from paleta.color import Color
+from paleta.image import convert_palette
+from paleta.palette import ConversionPalette
+from paleta.quality import conversion_quality, delta_e
+
+
+@pytest.fixture
+def pixels():
+    pixels = np.zeros((20, 10, 4), dtype=np.uint8)
+    pixels[:10] = (200, 40, 40, 255)
+    pixels[10:15] = (40, 40, 200, 255)
+    return pixels
+
+
+def test_delta_e():
+    assert delta_e([[10, 20, 30]], [[10, 20, 30]])[0] == 0
+    assert delta_e([[0, 0, 0]], [[255, 255, 255]])[0] == pytest.approx(100, abs=1e-3)
+
+
+def test_conversion_quality(pixels):
+    cmap = ConversionPalette({Color(200, 40, 40): Color(200, 40, 40), Color(40, 40, 200): Color(40, 60, 200)})
+    converted = np.empty_like(pixels)
+    convert_palette(pixels, cmap, converted)
+
+    quality = conversion_quality(pixels, converted)
+    error = delta_e([[40, 40, 200]], [[40, 60, 200]])[0]
+
+    assert quality.pixels == 150
+    assert quality.mean_error == pytest.approx(error * 50 / 150)
+    assert quality.max_error == pytest.approx(error)
+    assert quality.psnr == pytest.approx(10 * math.log10(255 ** 2 / (400 * 50 / (3 * 150))))
+
+    entries = quality.per_entry()
+    assert entries[0][0] == Color(40, 60, 200)
+    assert entries[0][1:3] == (50, pytest.approx(error))
+    assert entries[1][1:] == (100, 0.0, 0.0)
+
+    assert quality.passes(max_mean=error)
+    assert not quality.passes(max_mean=error, max_error=1)
+
+    by_cmap = conversion_quality(pixels, cmap=cmap, workers=2, tile_rows=3)
+    assert by_cmap.to_dict() == quality.to_dict()
+
+
+def test_conversion_quality_identity(pixels):
+    quality = conversion_quality(pixels, pixels.copy(), alpha_threshold=-1)
+    assert quality.pixels == 200
+    assert quality.mean_error == 0 and quality.psnr == math.inf
+
+    with pytest.raises(ValueError):
+        conversion_quality(pixels)
+    with pytest.raises(ValueError):
+        conversion_quality(pixels, pixels[:5])
@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from paleta.color import Color, color_average
+from paleta.palette import Palette
+from paleta.ramp import ramp, ramps, ramp_array, gradient_table
+
+
+def test_ramp_rgb():
+    black, white = Color.from_hex("000"), Color.from_hex("fff")
+
+    r = ramp([black, white], 2)
+    assert len(r) == 3
+    assert r[0] == black
+    assert r[1].irgb == (128, 128, 128)
+    assert r[-1] == white
+
+    r = ramp([black, Color.from_hex("f00"), white], 4)
+    assert len(r) == 9
+    assert r[4] == Color.from_hex("f00")
+    assert r == sorted(r[:5]) + r[5:]
+
+
+def test_ramp_midpoint_matches_average():
+    ca, cb = Color(10, 20, 30), Color(110, 120, 130)
+    assert ramp([ca, cb], 2)[1] == color_average(ca, cb)
+
+
+def test_ramp_spaces():
+    red, blue = Color.from_hex("f00"), Color.from_hex("00f")
+
+    for space in ("rgb", "hsl", "hsv", "oklab"):
+        r = ramp([red, blue], 8, space=space)
+        assert len(r) == 9
+        assert r[0] == red
+        assert r[-1] == blue
+
+    # Hue takes the shorter arc (red -> magenta -> blue)
+    assert ramp([red, blue], 2, space="hsl")[1].irgb == (255, 0, 255)
+
+    with pytest.raises(ValueError):
+        ramp([red, blue], 2, space="xyz")
+
+
+def test_ramp_easing():
+    stops = np.array([[0, 0, 0, 255], [255, 255, 255, 255]])
+
+    linear = ramp_array(stops, 4)
+    eased = ramp_array(stops, 4, easing="ease_in")
+    custom = ramp_array(stops, 4, easing=lambda t: t ** 3)
+    assert linear[1, 0] > eased[1, 0] > custom[1, 0]
+
+    with pytest.raises(ValueError):
+        ramp_array(stops, 4, easing="bounce")
+
+
+def test_ramp_easing_alpha_is_linear():
+    stops = np.array([[0, 0, 0, 0], [255, 255, 255, 255]])
+
+    eased = ramp_array(stops, 4, easing="ease_in")
+    assert eased[:, 3].tolist() == [0, 63.75, 127.5, 191.25, 255]
+    assert eased[:, 0].tolist() == [0, 16, 64, 143, 255]
+
+
+def test_ramps_batch():
+    batch = [
+        [Color.from_hex("000"), Color.from_hex("f00")],
+        [Color.from_hex("000"), Color.from_hex("0f0")],
+    ]
+
+    result = ramps(batch, 4, space="oklab")
+    assert len(result) == 2
+    assert result[0] == ramp(batch[0], 4, space="oklab")
+    assert result[1] == ramp(batch[1], 4, space="oklab")
+    assert ramp_array(np.zeros((100, 3, 4)), 16).shape == (100, 33, 4)
+
+
+def test_gradient_table():
+    colors = [Color(0, 0, 0), Color(255, 0, 0), Color(255, 255, 255)]
+
+    table = gradient_table(colors)
+    assert table.shape == (256, 4) and table.dtype == np.uint8
+    assert tuple(table[0]) == (0, 0, 0, 255)
+    assert tuple(table[255]) == (255, 255, 255, 255)
+    assert np.all(np.diff(table[:128, 0].astype(int)) >= 0)
+
+    bands = gradient_table(colors, smooth=False)
+    assert {tuple(c) for c in bands.tolist()} == {(0, 0, 0, 255), (255, 0, 0, 255), (255, 255, 255, 255)}
+    assert len(gradient_table([Color(1, 2, 3)], size=16)) == 16
+
+    with pytest.raises(ValueError):
+        gradient_table([])
+
+
+def test_gradient_table_palette_order():
+    colors = [Color(0, 0, 0), Color(255, 0, 0), Color(255, 255, 255)]
+
+    # Palettes are unordered, their stops go darkest first
+    assert np.array_equal(gradient_table(Palette(*colors)), gradient_table(colors))
+    assert ramp(Palette(*reversed(colors)), 2) == ramp(colors, 2)
+    assert ramps([Palette(*colors)], 2) == [ramp(colors, 2)]
+
+    # Same table whatever the string hash seed of the process
+    code = ("from paleta.color import Color; from paleta.palette import Palette; from paleta.ramp import gradient_table; "
+            "print(gradient_table(Palette(Color(0, 0, 0), Color(255, 0, 0), Color(255, 255, 255))).tobytes().hex())")
+    tables = {
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                       env={**os.environ, "PYTHONHASHSEED": str(seed)}).stdout
+        for seed in range(4)
+    }
+    assert len(tables) == 1
+
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from paleta.color import Color
+from paleta.palette import Palette, ConversionPalette
+from paleta.reduce import reduce_palette, reduce_conversion
+
+
+@pytest.fixture
+def palette_object():
+    return Palette(
+        Color(0, 0, 0),
+        Color(10, 0, 0),
+        Color(0, 10, 0),
+        Color(250, 250, 250),
+        Color(255, 255, 255),
+        Color(200, 0, 0),
+    )
+
+
+def test_reduce_palette_size(palette_object):
+    result = reduce_palette(palette_object, 3)
+    assert isinstance(result, Palette)
+    assert len(result) == 3
+    assert Color(200, 0, 0) in result
+
+    assert reduce_palette(palette_object, 10) == palette_object
+    assert len(reduce_palette(palette_object, 1)) == 1
+
+
+def test_reduce_palette_random():
+    rng = np.random.default_rng(0)
+    colors = [Color(*c) for c in rng.integers(0, 256, (300, 3)).tolist()]
+
+    for space in ("rgb", "oklab", "lab"):
+        assert len(reduce_palette(colors, 16, space=space)) == 16
+
+
+def test_reduce_palette_hue_wrap():
+    # Both reds sit on either side of hue 0, they merge before either joins the blue
+    colors = [Color(255, 0, 10), Color(255, 10, 0), Color(0, 0, 255)]
+
+    for space in ("rgb", "oklab", "lab"):
+        result = reduce_palette(colors, 2, space=space)
+        assert Color(0, 0, 255) in result
+        assert all(c.r > 240 and c.b < 10 for c in result if c != Color(0, 0, 255))
+
+
+def test_reduce_palette_weights(palette_object):
+    colors = palette_object.to_list()
+    weights = {c: 1 for c in colors} | {Color(250, 250, 250): 1000}
+
+    result = reduce_palette(colors, 4, weights=weights)
+    assert Color(250, 250, 250) in result
+    assert Color(255, 255, 255) not in result
+
+    weights = {c: 1 for c in colors} | {Color(255, 255, 255): 1000}
+    result = reduce_palette(colors, 4, weights=weights)
+    assert Color(255, 255, 255) in result
+    assert Color(250, 250, 250) not in result
+
+
+def test_reduce_conversion(palette_object):
+    result = reduce_conversion(palette_object, 3)
+    assert isinstance(result, ConversionPalette)
+    assert len(result) == len(palette_object)
+
+    cmap = result.to_dict()
+    targets = {Color(*v) for v in cmap.values()}
+    assert len(targets) == 3
+    assert cmap[Color(0, 0, 0).rgba] == cmap[Color(10, 0, 0).rgba]
+    assert cmap[Color(250, 250, 250).rgba] == cmap[Color(255, 255, 255).rgba]
+
+
+def test_reduce_errors(palette_object):
+    with pytest.raises(ValueError):
+        reduce_palette(palette_object, 0)
+    with pytest.raises(ValueError):
+        reduce_conversion(palette_object, 0)
+    with pytest.raises(ValueError):
+        reduce_palette(palette_object, 2, weights=[1, 2])
+    with pytest.raises(ValueError):
+        reduce_palette(palette_object, 2, space="xyz")
+    with pytest.raises(ValueError):
+        reduce_conversion(palette_object, 10, space="hsl")
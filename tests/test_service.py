@@ -0,0 +1,138 @@
+import json
+import os
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from PIL import Image
+
+from paleta.service import PaletteServer, PaletteService
+
+
+@pytest.fixture
+def server():
+    server = PaletteServer(workers=4)
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    f = tmp_path / "sprite.png"
+    image = Image.new("RGBA", (4, 4), (83, 19, 128, 255))
+    image.putpixel((0, 0), (248, 198, 48, 255))
+    image.save(f)
+    return str(f)
+
+
+def _request(server, path, payload=None, headers=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    headers = {"Content-Type": "application/json", **(headers or {})}
+    try:
+        with urllib.request.urlopen(urllib.request.Request(server.url + path, data=data, headers=headers)) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_service_extract(server, image_file):
+    status, response = _request(server, "/extract", {"image": image_file})
+    assert status == 200
+    assert response["colors"] == [[83, 19, 128, 255], [248, 198, 48, 255]]
+
+    assert _request(server, "/health") == (200, {"status": "ok"})
+
+
+def test_service_map_convert(server, image_file, tmp_path):
+    target = {"colors": ["#000", "#fff"]}
+
+    status, response = _request(server, "/map", {"source": {"image": image_file}, "target": target})
+    assert status == 200
+    assert [[83, 19, 128, 255], [0, 0, 0, 255]] in response["cmap"]
+    assert [[248, 198, 48, 255], [255, 255, 255, 255]] in response["cmap"]
+
+    f_out = str(tmp_path / "out.png")
+    status, response = _request(server, "/convert", {"image": image_file, "output": f_out, "target": target})
+    assert status == 200
+    assert Image.open(f_out).getpixel((0, 0)) == (255, 255, 255, 255)
+    assert Image.open(f_out).getpixel((1, 1)) == (0, 0, 0, 255)
+
+    status, _ = _request(server, "/convert", {"image": image_file, "output": f_out, "cmap": [["#531380", [1, 2, 3]]]})
+    assert status == 200
+    assert Image.open(f_out).getpixel((1, 1)) == (1, 2, 3, 255)
+
+
+def test_service_export(server, tmp_path):
+    f_out = str(tmp_path / "palette.png")
+    status, _ = _request(server, "/export", {"colors": ["#f00", "#00f"], "output": f_out, "size": [2, 2]})
+
+    assert status == 200
+    assert Image.open(f_out).size == (4, 2)
+    assert Image.open(f_out).getpixel((3, 0)) == (0, 0, 255, 255)
+
+
+def test_service_errors(server, tmp_path):
+    assert _request(server, "/unknown", {})[0] == 404
+    assert _request(server, "/nothing")[0] == 404
+    assert _request(server, "/extract", {"image": str(tmp_path / "missing.png")})[0] == 400
+    assert _request(server, "/map", {"source": {"colors": ["#fff"]}})[0] == 400
+
+
+def test_service_rejects_foreign_requests(server, image_file, tmp_path):
+    payload = {"image": image_file, "output": str(tmp_path / "out.png")}
+
+    # A browser page can send these without a preflight
+    assert _request(server, "/export", payload, {"Content-Type": "text/plain"})[0] == 403
+    assert _request(server, "/export", payload, {"Content-Type": "application/x-www-form-urlencoded"})[0] == 403
+    assert _request(server, "/export", payload, {"Origin": "https://example.com"})[0] == 403
+    assert _request(server, "/export", payload, {"Host": "attacker.example:8765"})[0] == 403
+    assert _request(server, "/metrics", headers={"Host": "attacker.example:8765"})[0] == 403
+    assert not os.path.exists(payload["output"])
+
+    port = server.server_address[1]
+    assert _request(server, "/health", headers={"Host": f"localhost:{port}"})[0] == 200
+    assert _request(server, "/extract", {"image": image_file}, {"Content-Type": "application/json; charset=utf-8"})[0] == 200
+    assert _request(server, "/export", payload)[0] == 200
+    assert os.path.exists(payload["output"])
+
+
+def test_service_metrics_and_warm_cache(server, image_file):
+    payload = {"source": {"image": image_file}, "target": {"colors": ["#000", "#fff"]}}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: _request(server, "/map", payload), range(16)))
+    assert all(status == 200 for status, _ in results)
+
+    status, metrics = _request(server, "/metrics")
+    assert status == 200
+    assert metrics["endpoints"]["map"]["requests"] == 16
+    assert metrics["endpoints"]["map"]["errors"] == 0
+    assert metrics["endpoints"]["map"]["max_ms"] >= metrics["endpoints"]["map"]["mean_ms"] > 0
+    assert metrics["throughput_rps"] > 0
+    assert metrics["cache"] == {"palettes": 2, "tables": 1, "evictions": {"palettes": 0, "tables": 0}}
+
+
+def test_service_cache_eviction(image_file):
+    service = PaletteService(max_palettes=2, max_tables=1)
+    target = {"colors": ["#000", "#fff"]}
+
+    first = service.table({"image": image_file}, target)
+    assert service.table({"image": image_file}, target) is first
+
+    # Editing the image changes its key, the stale palette and table are evicted
+    stat = os.stat(image_file)
+    os.utime(image_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert service.table({"image": image_file}, target) is not first
+
+    cache = service.metrics()["cache"]
+    assert cache == {"palettes": 2, "tables": 1, "evictions": {"palettes": 1, "tables": 1}}
+
+    # Recently used entries are kept
+    service.palette(target)
+    service.palette({"colors": ["#f00"]})
+    assert service.metrics()["cache"]["evictions"]["palettes"] == 2
+    assert service._palette_key(target) in service._palettes
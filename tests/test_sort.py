@@ -0,0 +1,60 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from paleta.color import Color
+from paleta.palette import Palette
+from paleta.sort import sort_palette, sort_order, hilbert_key
+
+
+@pytest.fixture
+def palette_object():
+    return Palette(
+        Color.from_hex("#531380"),
+        Color.from_hex("#d7820e"),
+        Color.from_hex("#60d048"),
+        Color.from_hex("#f8c630"),
+        Color.from_hex("#000"),
+        Color.from_hex("#fff"),
+    )
+
+
+def test_sort_lightness(palette_object):
+    result = sort_palette(palette_object)
+    assert len(result) == len(palette_object)
+    assert set(result) == palette_object.colors
+    assert [c.to_lightness() for c in result] == sorted(c.to_lightness() for c in palette_object)
+
+    result = sort_palette(palette_object, reverse=True)
+    assert result[0] == Color.from_hex("#fff")
+    assert result[-1] == Color.from_hex("#000")
+
+
+def test_sort_hue(palette_object):
+    result = sort_palette(palette_object, by="hue")
+    assert set(result) == palette_object.colors
+    assert result.index(Color.from_hex("#d7820e")) < result.index(Color.from_hex("#60d048"))
+    assert result.index(Color.from_hex("#60d048")) < result.index(Color.from_hex("#531380"))
+
+
+def test_sort_hilbert(palette_object):
+    result = sort_palette(palette_object.to_list(), by="hilbert")
+    assert set(result) == palette_object.colors
+    assert result[0] == Color.from_hex("#000")
+
+
+def test_hilbert_key_adjacency():
+    points = np.array(list(itertools.product(range(8), repeat=3)))
+    keys = hilbert_key(points << 5, bits=3)
+
+    assert sorted(keys.tolist()) == list(range(8 ** 3))
+    steps = np.abs(np.diff(points[np.argsort(keys)], axis=0)).sum(axis=1)
+    assert np.all(steps == 1)
+
+
+def test_sort_invalid(palette_object):
+    assert sort_palette(Palette()) == []
+
+    with pytest.raises(ValueError):
+        sort_order(np.zeros((2, 4)), by="chroma")
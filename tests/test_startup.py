@@ -0,0 +1,66 @@
+import json
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("requests", "PIL", "numpy")
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+def _loaded(statement: str) -> list:
+    code = f"import json, sys; {statement}; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    return json.loads(_run(code).stdout)
+
+
+def _submodules(statement: str) -> list:
+    code = f"import json, sys; {statement}; print(json.dumps(sorted(m for m in sys.modules if m.startswith('paleta'))))"
+    return json.loads(_run(code).stdout)
+
+
+@pytest.mark.parametrize("statement", [
+    "import paleta",
+    "import paleta.color",
+    "import paleta.palette",
+    "from paleta import Color, Palette, ConversionPalette",
+])
+def test_startup_is_lazy(statement):
+    assert _loaded(statement) == []
+
+
+def test_startup_loads_on_first_use():
+    assert "PIL" in _loaded("import paleta; paleta.convert_palette")
+    assert "numpy" in _loaded("import paleta; paleta.ramps")
+
+
+def test_startup_submodules():
+    assert _submodules("import paleta") == ["paleta", "paleta.version"]
+    assert _submodules("import paleta.color") == ["paleta", "paleta.color", "paleta.version"]
+    assert "paleta.image" in _submodules("import paleta; paleta.convert_palette")
+
+
+def test_facade_exports():
+    import paleta
+
+    assert paleta.Color is __import__("paleta.color", fromlist=["Color"]).Color
+    assert "Palette" in dir(paleta)
+
+    with pytest.raises(AttributeError):
+        paleta.DoesNotExist
+
+
+def test_facade_exports_after_submodules():
+    import paleta
+    import paleta.image
+
+    assert callable(paleta.ramps)
+    assert callable(paleta.ramp.ramp)
+
+    # Importing a submodule replaces a facade name of the same name
+    assert not {m.name for m in pkgutil.iter_modules(paleta.__path__)} & set(paleta._EXPORTS)
+    for name in paleta._EXPORTS:
+        assert callable(getattr(paleta, name)), name